@@ -13,7 +13,7 @@ import sys
 sys.path.insert(0, ".")   # remove this line after: pip install experience-engine
 
 from experience_engine import (
-    log_interaction,
+    log_interactions,
     run_reflection,
     run_synthesis,
     format_cognitive_block,
@@ -27,21 +27,16 @@ config = EngineConfig(data_dir="experience", model="mistral")
 
 # ── Step 1: Log some interactions ─────────────────────────────────────────────
 print("Step 1: Logging interactions…")
-log_interaction("What is the main teaching of the Bhagavad Gita?",
-                "Selfless action (nishkama karma) — do your duty without attachment to results.",
-                config=config)
-
-log_interaction("What are the three margas?",
-                "Karma Marga (action), Jnana Marga (knowledge), Bhakti Marga (devotion).",
-                config=config)
-
-log_interaction("Should I use a cloud database or local files for my AI system?",
-                "Given your preference for control, start local. Postgres when you hit real scale.",
-                config=config)
-
-log_interaction("Should I learn all three margas simultaneously?",
-                "You can explore all three, but many teachers recommend starting with Karma Marga.",
-                config=config)
+log_interactions([
+    ("What is the main teaching of the Bhagavad Gita?",
+     "Selfless action (nishkama karma) — do your duty without attachment to results."),
+    ("What are the three margas?",
+     "Karma Marga (action), Jnana Marga (knowledge), Bhakti Marga (devotion)."),
+    ("Should I use a cloud database or local files for my AI system?",
+     "Given your preference for control, start local. Postgres when you hit real scale."),
+    ("Should I learn all three margas simultaneously?",
+     "You can explore all three, but many teachers recommend starting with Karma Marga."),
+], config=config)
 
 # ── Step 2: Reflect — extract domain beliefs ───────────────────────────────────
 print("\nStep 2: Reflecting…")
@@ -8,16 +8,20 @@ Public API (three entry points):
 
     log_interaction(question, answer, config?, extra_tags?) -> dict
     run_reflection(config?, llm_fn?, verbose?) -> list[dict]
-    run_synthesis(config?, llm_fn?, verbose?) -> dict
+    run_synthesis(config?, llm_fn?, verbose?, force?) -> dict
 
 Supporting functions:
 
+    log_interactions(pairs, config?) -> list[dict]
+    iter_log(config?) -> Iterator[dict]
     load_beliefs(config?) -> list[dict]
     load_patterns(config?) -> dict
     load_tensions(config?) -> list[dict]
-    format_belief_block(beliefs?, config?) -> str
+    format_belief_block(beliefs?, config?, question?) -> str
     format_cognitive_block(config?) -> str
     apply_patterns(situation, config?, llm_fn?) -> str
+    apply_patterns_batch(situations, config?, llm_fn?, batch_size?) -> list[str]
+    run_reflection_and_synthesis(config?, llm_fn?, verbose?) -> dict
 
 Configuration:
 
@@ -42,35 +46,57 @@ Example:
     prompt = format_cognitive_block() + format_belief_block() + "User: " + question
 """
 
+import importlib
+
 from .config import EngineConfig, default_config
 
 from .core import (
     log_interaction,
+    log_interactions,
     load_log,
+    iter_log,
     log_count,
 )
 
-from .reflection import (
-    run_reflection,
-    load_beliefs,
-    format_belief_block,
-)
-
-from .synthesis import (
-    run_synthesis,
-    load_patterns,
-    load_tensions,
-    format_cognitive_block,
-    apply_patterns,
-)
-
 from .ingest import (
     ingest,
     ingest_file,
+    ingest_files,
     IngestResult,
     SUPPORTED_PLATFORMS,
 )
 
+# Reflection and synthesis (and the LLM adapter behind them) are imported on
+# first attribute access (PEP 562), so scripts that only log interactions
+# don't pay for the whole stack at import time.
+_LAZY = {
+    "run_reflection":               "reflection",
+    "load_beliefs":                 "reflection",
+    "format_belief_block":          "reflection",
+    "run_synthesis":                "synthesis",
+    "load_patterns":                "synthesis",
+    "load_tensions":                "synthesis",
+    "format_cognitive_block":       "synthesis",
+    "apply_patterns":               "synthesis",
+    "apply_patterns_batch":         "synthesis",
+    "run_reflection_and_synthesis": "synthesis",
+}
+
+
+def __getattr__(name: str):
+    try:
+        module = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
+
+
 __version__ = "0.2.0"
 __all__ = [
     # config
@@ -78,7 +104,9 @@ __all__ = [
     "default_config",
     # core
     "log_interaction",
+    "log_interactions",
     "load_log",
+    "iter_log",
     "log_count",
     # reflection (V1)
     "run_reflection",
@@ -90,9 +118,12 @@ __all__ = [
     "load_tensions",
     "format_cognitive_block",
     "apply_patterns",
+    "apply_patterns_batch",
+    "run_reflection_and_synthesis",
     # ingestion
     "ingest",
     "ingest_file",
+    "ingest_files",
     "IngestResult",
     "SUPPORTED_PLATFORMS",
 ]
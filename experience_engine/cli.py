@@ -12,32 +12,50 @@ Entry points for installed CLI commands:
 import argparse
 import json
 import sys
+from itertools import groupby
+from operator import itemgetter
 
 from .config import EngineConfig, default_config
 from .core import log_count
 from .reflection import run_reflection, load_beliefs
-from .synthesis import run_synthesis, load_patterns, load_tensions, apply_patterns
+from .synthesis import (
+    run_synthesis, load_patterns, load_tensions, apply_patterns, apply_patterns_batch,
+)
 
 
 # ── Shared display ─────────────────────────────────────────────────────────────
 
+_HR = "═" * 64
+
+# precomputed bars for the two widths the display uses
+_BARS = {width: tuple("█" * i for i in range(width + 1)) for width in (10, 20)}
+
+
 def _bar(conf: float, width: int = 10) -> str:
-    return "█" * round(conf * width)
+    k = round(conf * width)
+    bars = _BARS.get(width)
+    if bars is None or not 0 <= k <= width:
+        return "█" * k
+    return bars[k]
 
 
 def _display_beliefs(beliefs: list[dict]):
     if not beliefs:
         print("  No beliefs yet. Run: experience-reflect")
         return
-    by_cat: dict[str, list] = {}
-    for b in beliefs:
-        by_cat.setdefault(b.get("category", "other"), []).append(b)
-    for cat, items in sorted(by_cat.items()):
+    # one sort by (category, -confidence), then walk the runs of each category
+    rows = [
+        (b.get("category", "other"), -b.get("confidence", 0), b["belief"], b.get("evidence"))
+        for b in beliefs
+    ]
+    rows.sort(key=itemgetter(0, 1))
+    for cat, items in groupby(rows, key=itemgetter(0)):
         print(f"\n  [{cat.upper().replace('_',' ')}]")
-        for b in sorted(items, key=lambda x: -x.get("confidence", 0)):
-            print(f"  {_bar(b['confidence']):<10} {b['confidence']:.2f}  {b['belief']}")
-            if b.get("evidence"):
-                print(f"             ↳ {b['evidence']}")
+        for _, neg_conf, belief, evidence in items:
+            conf = -neg_conf
+            print(f"  {_bar(conf):<10} {conf:.2f}  {belief}")
+            if evidence:
+                print(f"             ↳ {evidence}")
 
 
 def _display_patterns(patterns_data: dict, tensions: list[dict]):
@@ -47,9 +65,9 @@ def _display_patterns(patterns_data: dict, tensions: list[dict]):
     ec      = patterns_data.get("experience_compression", {})
     synth_n = patterns_data.get("synthesis_count", 0)
 
-    print(f"\n{'═'*64}")
+    print(f"\n{_HR}")
     print(f"  COGNITIVE SIGNATURE  (synthesis #{synth_n})")
-    print(f"{'═'*64}")
+    print(_HR)
 
     if any(ladder.values()):
         print("\n  [ABSTRACTION LADDER]")
@@ -107,17 +125,25 @@ def cmd_synthesize():
     parser = argparse.ArgumentParser(description="Run V2 synthesis: beliefs → cognitive patterns")
     parser.add_argument("--data-dir", default="experience", help="data directory path")
     parser.add_argument("--model",    default="mistral",    help="Ollama model name")
-    parser.add_argument("--transfer", type=str, default=None, help="apply patterns to situation")
+    parser.add_argument("--transfer", action="append", default=None,
+                        help="apply patterns to situation (repeatable, run concurrently)")
+    parser.add_argument("--force",    action="store_true",
+                        help="re-synthesize even if beliefs are unchanged")
     args = parser.parse_args()
 
     config = EngineConfig(data_dir=args.data_dir, model=args.model)
 
     if args.transfer:
-        print(f"\n[Transfer → {args.transfer}]\n")
-        print(apply_patterns(args.transfer, config=config))
+        if len(args.transfer) == 1:
+            analyses = [apply_patterns(args.transfer[0], config=config)]
+        else:
+            analyses = apply_patterns_batch(args.transfer, config=config)
+        for situation, analysis in zip(args.transfer, analyses):
+            print(f"\n[Transfer → {situation}]\n")
+            print(analysis)
         return
 
-    result = run_synthesis(config=config)
+    result = run_synthesis(config=config, force=args.force)
     if result:
         _display_patterns(load_patterns(config), load_tensions(config))
 
@@ -138,9 +164,9 @@ def cmd_show():
     show_all = not (args.beliefs or args.patterns or args.tensions)
 
     if args.beliefs or show_all:
-        print(f"\n{'═'*64}")
+        print(f"\n{_HR}")
         print(f"  V1 BELIEFS  ({len(beliefs)} total | {log_count(config)} interactions logged)")
-        print("═"*64)
+        print(_HR)
         _display_beliefs(beliefs)
 
     if args.patterns or args.tensions or show_all:
@@ -152,30 +178,42 @@ def cmd_ingest():
     """Ingest social media exports into the experience log."""
     import argparse as _ap
     parser = _ap.ArgumentParser(description="Ingest social media exports")
-    parser.add_argument("file",       help="path to the export file")
+    parser.add_argument("file",       nargs="+",            help="path to the export file(s)")
     parser.add_argument("--platform", default=None,         help="platform name (auto-detected if omitted)")
     parser.add_argument("--user",     default=None,         help="your display name on the platform")
     parser.add_argument("--data-dir", default="experience", help="data directory path")
     args = parser.parse_args()
 
-    from .ingest import ingest_file
+    from .ingest import ingest_file, ingest_files
     config = EngineConfig(data_dir=args.data_dir)
 
-    print(f"[ingest] Reading {args.file}...")
-    result = ingest_file(
-        filepath    = args.file,
-        platform    = args.platform,
-        config      = config,
-        user_handle = args.user,
-        verbose     = True,
-    )
+    if len(args.file) == 1:
+        print(f"[ingest] Reading {args.file[0]}...")
+        results = [ingest_file(
+            filepath    = args.file[0],
+            platform    = args.platform,
+            config      = config,
+            user_handle = args.user,
+            verbose     = True,
+        )]
+    else:
+        print(f"[ingest] Reading {len(args.file)} files...")
+        results = ingest_files(
+            filepaths   = args.file,
+            platform    = args.platform,
+            config      = config,
+            user_handle = args.user,
+            verbose     = True,
+        )
 
-    if result.errors:
-        print("[ingest] Errors:")
-        for e in result.errors:
-            print(f"  x {e}")
+    for path, result in zip(args.file, results):
+        if result.errors:
+            print(f"[ingest] Errors ({path}):" if len(results) > 1 else "[ingest] Errors:")
+            for e in result.errors:
+                print(f"  x {e}")
 
-    print(f"[ingest] Done. {result.total_ingested} entries added to your experience log.")
+    total = sum(r.total_ingested for r in results)
+    print(f"[ingest] Done. {total} entries added to your experience log.")
     print("[ingest] Run experience-reflect next to extract beliefs from this data.")
 
 
@@ -185,14 +223,18 @@ def cmd_chat():
     parser.add_argument("--data-dir",   default="experience", help="data directory path")
     parser.add_argument("--model",      default="mistral",    help="Ollama model name")
     parser.add_argument("--no-context", action="store_true",  help="disable experience injection")
+    parser.add_argument("--top-k",      type=int, default=None,
+                        help="inject only the K beliefs most relevant to each question")
     args = parser.parse_args()
 
     from .reflection import format_belief_block
     from .synthesis  import format_cognitive_block
     from .core       import log_interaction
-    from .llm        import call
+    from .llm        import stream
 
     config = EngineConfig(data_dir=args.data_dir, model=args.model)
+    if args.top_k is not None:
+        config.belief_top_k = args.top_k
 
     SYSTEM = (
         "You are a senior advisor with deep knowledge of this user's cognitive patterns. "
@@ -200,10 +242,10 @@ def cmd_chat():
         "Identify where their specific wiring creates risk. Be direct and specific.\n\n"
     )
 
-    print(f"\n{'═'*64}")
+    print(f"\n{_HR}")
     print("  Experience Engine — chat")
     print(f"  Context: {'OFF' if args.no_context else 'ON'}  |  Ctrl+C to exit")
-    print(f"{'═'*64}\n")
+    print(f"{_HR}\n")
 
     history: list[tuple[str, str]] = []
 
@@ -217,7 +259,7 @@ def cmd_chat():
             continue
 
         context = "" if args.no_context else (
-            format_cognitive_block(config) + format_belief_block(config=config)
+            format_cognitive_block(config) + format_belief_block(config=config, question=question)
         )
 
         conv = ""
@@ -228,13 +270,17 @@ def cmd_chat():
 
         prompt = SYSTEM + context + conv + f"User: {question}\nAssistant:"
 
+        print("\nAssistant: ", end="", flush=True)
+        parts: list[str] = []
         try:
-            answer = call(prompt, temperature=0.7, config=config)
+            for token in stream(prompt, temperature=0.7, config=config):
+                print(token, end="", flush=True)
+                parts.append(token)
         except RuntimeError as e:
             print(f"\n{e}\n")
             continue
-
-        print(f"\nAssistant: {answer}\n")
+        answer = "".join(parts)
+        print("\n")
         entry = log_interaction(question, answer, config=config)
         history.append((question, answer))
         print(f"  [logged | conf: {entry['confidence']:.2f}]\n")
@@ -6,10 +6,26 @@ Override via environment variables or by passing config= to any public function.
 """
 
 import os
+from functools import cached_property
 from pathlib import Path
 from dataclasses import dataclass, field
 
 
+# Derived file paths, cached on first access and dropped when data_dir changes
+_PATH_ATTRS = (
+    "log_file", "count_file", "belief_file", "pattern_file", "tension_file",
+    "index_file", "embed_cache_file",
+)
+
+
+def _env_concurrency() -> int:
+    """OLLAMA_NUM_PARALLEL as a positive int; 4 if unset, blank or not a number."""
+    try:
+        return max(1, int(os.environ.get("OLLAMA_NUM_PARALLEL", "").strip() or 4))
+    except ValueError:
+        return 4
+
+
 @dataclass
 class EngineConfig:
     # Storage — defaults to ./experience/ relative to CWD
@@ -24,14 +40,31 @@ class EngineConfig:
     model: str = field(
         default_factory=lambda: os.environ.get("EXPERIENCE_MODEL", "mistral")
     )
+    # max LLM requests in flight — match Ollama's OLLAMA_NUM_PARALLEL
+    concurrency: int = field(default_factory=_env_concurrency)
+
+    # Embeddings (only used when belief_top_k > 0)
+    ollama_embed_url: str = field(
+        default_factory=lambda: os.environ.get(
+            "OLLAMA_EMBED_URL", "http://localhost:11434/api/embeddings"
+        )
+    )
+    embed_model: str = field(
+        default_factory=lambda: os.environ.get("EXPERIENCE_EMBED_MODEL", "nomic-embed-text")
+    )
 
     # Reflection settings
     reflection_window: int = 50       # how many recent interactions to analyze
     min_belief_confidence: float = 0.6
+    belief_top_k: int = 0             # beliefs injected per chat turn by relevance (0 = all)
 
     # Synthesis settings
     synthesis_window: int = 200       # interactions fed into pattern synthesis
     min_pattern_confidence: float = 0.65
+    max_prompt_patterns: int = 12     # strongest patterns injected into prompts (0 = all)
+    pretty_json: bool = False         # indent cognitive_patterns.json / tensions.json for reading by hand
+    json_retry: bool = True           # retry an unparseable synthesis reply once in Ollama's JSON mode
+    synth_shard_threshold: int = 60   # above this many beliefs, synthesize in concurrent shards (0 = never)
 
     # Response behavior
     context_window: int = 6           # conversation turns kept in prompt
@@ -40,25 +73,41 @@ class EngineConfig:
     llm_temperature_synthesize: float = 0.25
     llm_timeout: int = 180
 
-    def __post_init__(self):
-        self.data_dir = Path(self.data_dir)
+    def __setattr__(self, name, value):
+        if name == "data_dir":
+            value = Path(value)
+            for attr in _PATH_ATTRS:
+                self.__dict__.pop(attr, None)
+        super().__setattr__(name, value)
 
-    @property
+    @cached_property
     def log_file(self) -> Path:
         return self.data_dir / "episodic_log.jsonl"
 
-    @property
+    @cached_property
+    def count_file(self) -> Path:
+        return self.data_dir / "episodic_log.count"
+
+    @cached_property
     def belief_file(self) -> Path:
         return self.data_dir / "beliefs.json"
 
-    @property
+    @cached_property
     def pattern_file(self) -> Path:
         return self.data_dir / "cognitive_patterns.json"
 
-    @property
+    @cached_property
     def tension_file(self) -> Path:
         return self.data_dir / "tensions.json"
 
+    @cached_property
+    def index_file(self) -> Path:
+        return self.data_dir / "index.sqlite"
+
+    @cached_property
+    def embed_cache_file(self) -> Path:
+        return self.data_dir / "embed_cache.sqlite"
+
     def ensure_dirs(self):
         self.data_dir.mkdir(parents=True, exist_ok=True)
 
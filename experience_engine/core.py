@@ -5,39 +5,112 @@ Interaction logging — the foundation everything else reads from.
 
 Public API:
     log_interaction(question, answer, config) -> dict
+    log_interactions(pairs, config) -> list[dict]
     load_log(n, config) -> list[dict]
+    iter_log(config) -> Iterator[dict]
 """
 
-import json
+import os
 import re
-import uuid
 from datetime import datetime, timezone
+from itertools import chain
 from pathlib import Path
+from typing import Iterable, Iterator
 
 from .config import EngineConfig, default_config
+from . import jsonio
 
 
 # ── Auto-tagging ──────────────────────────────────────────────────────────────
 
 _TAG_PATTERNS: dict[str, str] = {
-    "infrastructure": r"\b(docker|k8s|kubernetes|nginx|server|deploy|cloud|aws|gcp|azure|local)\b",
-    "ai_ml":          r"\b(llm|model|embedding|rag|vector|fine.?tun|inference|ollama|mistral|gpt)\b",
-    "python":         r"\b(python|pip|venv|fastapi|flask|django|pydantic)\b",
-    "architecture":   r"\b(architecture|design|pattern|scalab|microservice|monolith|system)\b",
-    "debugging":      r"\b(error|bug|fix|broken|fail|crash|exception|traceback)\b",
-    "preference":     r"\b(prefer|rather|instead|avoid|hate|love|like|dislike|want)\b",
-    "goal":           r"\b(goal|want to|trying to|building|create|launch|ship)\b",
-    "frustration":    r"\b(frustrat|annoy|slow|complic|overengineer|too much|wrong)\b",
-    "spirituality":   r"\b(gita|krishna|karma|jnana|bhakti|dharma|marga|yoga|vedic|spiritual)\b",
-    "correction":     r"\b(no,|wrong|incorrect|not right|that's not|actually,)\b",
-    "investing":      r"\b(invest|stock|market|portfolio|value|p/e|dividend|equity|asset)\b",
-    "learning":       r"\b(learn|study|understand|teach|master|curriculum|course|practice)\b",
+    "infrastructure": r"\b(?:docker|k8s|kubernetes|nginx|server|deploy|cloud|aws|gcp|azure|local)\b",
+    "ai_ml":          r"\b(?:llm|model|embedding|rag|vector|fine.?tun|inference|ollama|mistral|gpt)\b",
+    "python":         r"\b(?:python|pip|venv|fastapi|flask|django|pydantic)\b",
+    "architecture":   r"\b(?:architecture|design|pattern|scalab|microservice|monolith|system)\b",
+    "debugging":      r"\b(?:error|bug|fix|broken|fail|crash|exception|traceback)\b",
+    "preference":     r"\b(?:prefer|rather|instead|avoid|hate|love|like|dislike|want)\b",
+    "goal":           r"\b(?:goal|want to|trying to|building|create|launch|ship)\b",
+    "frustration":    r"\b(?:frustrat|annoy|slow|complic|overengineer|too much|wrong)\b",
+    "spirituality":   r"\b(?:gita|krishna|karma|jnana|bhakti|dharma|marga|yoga|vedic|spiritual)\b",
+    "correction":     r"\b(?:no,|wrong|incorrect|not right|that's not|actually,)\b",
+    "investing":      r"\b(?:invest|stock|market|portfolio|value|p/e|dividend|equity|asset)\b",
+    "learning":       r"\b(?:learn|study|understand|teach|master|curriculum|course|practice)\b",
 }
 
 
-def _auto_tag(text: str) -> list[str]:
-    t = text.lower()
-    return [tag for tag, pat in _TAG_PATTERNS.items() if re.search(pat, t)]
+# _TAG_PATTERNS is compiled once into two matchers so _auto_tag can tag a text
+# in a single linear pass:
+#   - plain-word keywords ("docker", "karma", ...) go into a dict from word to
+#     tags. Because each pattern is \b(?:...)\b, a plain word matches exactly
+#     when it is a whole \w+ token, so a set of tokens plus dict lookups gives
+#     the same answer as the regexes, with no backtracking.
+#   - the rest ("fine.?tun", "want to", "p/e", "no,", ...) are joined into one
+#     small alternation with a named group per tag.
+
+def _compile_tag_matchers() -> tuple[dict[str, tuple[str, ...]], re.Pattern, dict[str, re.Pattern]]:
+    word_tags: dict[str, list[str]] = {}
+    residual: dict[str, str] = {}
+    for tag, pat in _TAG_PATTERNS.items():
+        rest = []
+        for kw in pat[len(r"\b(?:"):-len(r")\b")].split("|"):
+            if re.fullmatch(r"\w+", kw):
+                word_tags.setdefault(kw, []).append(tag)
+            else:
+                rest.append(kw)
+        if rest:
+            residual[tag] = rf"\b(?:{'|'.join(rest)})\b"
+    residual_re = re.compile("|".join(f"(?P<{tag}>{pat})" for tag, pat in residual.items()))
+    residual_res = {tag: re.compile(pat) for tag, pat in residual.items()}
+    return {w: tuple(tags) for w, tags in word_tags.items()}, residual_re, residual_res
+
+
+_WORD_RE = re.compile(r"\w+")
+_WORD_TAGS, _RESIDUAL_RE, _RESIDUAL_RES = _compile_tag_matchers()
+
+_HEDGES_RE = re.compile(
+    r"\b(?:maybe|perhaps|might|could|not sure|unclear|depends|uncertain|possibly)\b",
+    re.IGNORECASE,
+)
+
+
+# Residual keywords are at most 10 characters long, so a match that straddles
+# two texts lies within this many characters of the join.
+_JOIN_CONTEXT = 16
+
+
+def _residual_tags(t: str, found: set[str], start: int = 0, end: int | None = None):
+    """Add residual tags matched in t, keeping only matches that cover [start, end)."""
+    for m in _RESIDUAL_RE.finditer(t):
+        if end is not None and not (m.start() < end and m.end() > start):
+            continue
+        found.add(m.lastgroup)
+        # the union reports one group per position — re-check the others there
+        for tag, rx in _RESIDUAL_RES.items():
+            if tag not in found and rx.match(t, m.start()):
+                found.add(tag)
+
+
+def _auto_tag(*texts: str) -> set[str]:
+    """
+    Tag texts as if they were joined with spaces, without building the
+    joined string: each text is scanned on its own, plus a few characters
+    around each join for phrases ("want to") split across two texts.
+    """
+    found: set[str] = set()
+    words: set[str] = set()
+    prev = ""
+    for text in texts:
+        t = text.lower()
+        words.update(_WORD_RE.findall(t))
+        _residual_tags(t, found)
+        if prev:
+            head = prev[-_JOIN_CONTEXT:] + " "
+            _residual_tags(head + t[:_JOIN_CONTEXT], found, len(head) - 1, len(head))
+        prev = t
+    for word in words & _WORD_TAGS.keys():
+        found.update(_WORD_TAGS[word])
+    return found
 
 
 def _score_confidence(question: str, answer: str) -> float:
@@ -45,14 +118,71 @@ def _score_confidence(question: str, answer: str) -> float:
     Heuristic confidence score based on hedging language density.
     Replace with LLM-based scoring if you need precision.
     """
-    hedges = len(re.findall(
-        r"\b(maybe|perhaps|might|could|not sure|unclear|depends|uncertain|possibly)\b",
-        answer.lower(),
-    ))
-    length_ok = 50 < len(answer.split()) < 600
+    hedges = len(_HEDGES_RE.findall(answer))
+    # only whether the count lands in (50, 600) matters, so stop splitting at 600
+    length_ok = 50 < len(answer.split(None, 600)) < 600
     return round(max(0.3, min(0.95, 0.85 - (hedges * 0.08) + (0.05 if length_ok else 0))), 2)
 
 
+# ── Entry counter ─────────────────────────────────────────────────────────────
+# episodic_log.count holds "<entries> <log size in bytes>". The size lets
+# log_count() tell whether the counter still describes the log on disk; if the
+# log was changed behind our back the counter is rebuilt with a full scan.
+
+def _read_count(config: EngineConfig) -> tuple[int, int] | None:
+    try:
+        count, size = config.count_file.read_text().split()
+        return int(count), int(size)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_count(config: EngineConfig, count: int, size: int):
+    tmp = config.count_file.with_suffix(".count.tmp")
+    tmp.write_text(f"{count} {size}")
+    os.replace(tmp, config.count_file)
+
+
+def _bump_count(config: EngineConfig, before: int, after: int, added: int):
+    """Advance the counter after an append that grew the log from before to after bytes."""
+    if before == 0:
+        _write_count(config, added, after)
+        return
+    cached = _read_count(config)
+    if cached and cached[1] == before:
+        _write_count(config, cached[0] + added, after)
+    # otherwise leave it stale — log_count() notices the size mismatch and rebuilds
+
+
+def _build_entry(
+    question: str,
+    answer: str,
+    extra_tags: list[str] | None,
+    timestamp: str,
+) -> dict:
+    tags = _auto_tag(question, answer)
+    if extra_tags:
+        tags.update(extra_tags)
+
+    return {
+        "id":         os.urandom(4).hex(),
+        "timestamp":  timestamp,
+        "question":   question,
+        "answer":     answer,
+        "tags":       sorted(tags),
+        "confidence": _score_confidence(question, answer),
+    }
+
+
+def _open_log(config: EngineConfig, buffering: int = -1):
+    """Open the log for appending; the data dir is only created (and stat'ed) when missing."""
+    try:
+        return config.log_file.open("ab", buffering=buffering)
+    except FileNotFoundError:
+        config.ensure_dirs()
+        return config.log_file.open("ab", buffering=buffering)
+
+
 # ── Public API ────────────────────────────────────────────────────────────────
 
 def log_interaction(
@@ -77,25 +207,78 @@ def log_interaction(
         from experience_engine import log_interaction
         entry = log_interaction("What is karma yoga?", "Karma yoga is...")
     """
-    config.ensure_dirs()
+    entry = _build_entry(question, answer, extra_tags, datetime.now(timezone.utc).isoformat())
 
-    tags = _auto_tag(question + " " + answer)
-    if extra_tags:
-        tags = list(set(tags + extra_tags))
+    with _open_log(config) as f:
+        before = f.tell()
+        f.write(jsonio.dumps(entry) + b"\n")
+        _bump_count(config, before, f.tell(), 1)
 
-    entry = {
-        "id":         str(uuid.uuid4())[:8],
-        "timestamp":  datetime.now(timezone.utc).isoformat(),
-        "question":   question,
-        "answer":     answer,
-        "tags":       tags,
-        "confidence": _score_confidence(question, answer),
-    }
+    return entry
 
-    with config.log_file.open("a") as f:
-        f.write(json.dumps(entry) + "\n")
 
-    return entry
+def log_interactions(
+    pairs: Iterable[tuple],
+    config: EngineConfig = default_config,
+) -> list[dict]:
+    """
+    Append many interactions to the episodic log through a single open file.
+
+    Use this instead of calling log_interaction() in a loop (bulk imports,
+    replaying transcripts). pairs can be any iterable, including a generator;
+    entries are encoded and written through a 1 MB buffer as they are
+    produced. All entries share one timestamp.
+
+    Args:
+        pairs:  (question, answer) or (question, answer, extra_tags) tuples
+        config: EngineConfig
+
+    Returns:
+        The logged entries, in input order.
+
+    Example:
+        from experience_engine import log_interactions
+        log_interactions([
+            ("What is karma yoga?", "Selfless action..."),
+            ("Cloud or local?", "Start local...", ["infra"]),
+        ])
+    """
+    pairs = iter(pairs)
+    first = next(pairs, None)
+    if first is None:
+        return []
+
+    timestamp = datetime.now(timezone.utc).isoformat()
+    dumps = jsonio.dumps
+    entries: list[dict] = []
+
+    with _open_log(config, buffering=1 << 20) as f:
+        before = f.tell()
+        for p in chain((first,), pairs):
+            entry = _build_entry(p[0], p[1], p[2] if len(p) > 2 else None, timestamp)
+            f.write(dumps(entry) + b"\n")
+            entries.append(entry)
+        f.flush()
+        _bump_count(config, before, f.tell(), len(entries))
+
+    return entries
+
+
+def _tail_lines(path: Path, n: int) -> list[bytes]:
+    """Return the last n non-empty lines of a file, reading backwards from the end."""
+    with path.open("rb") as f:
+        size = f.seek(0, os.SEEK_END)
+        chunk = 64 * 1024
+        while True:
+            start = max(0, size - chunk)
+            f.seek(start)
+            lines = f.read(size - start).split(b"\n")
+            if start > 0:
+                lines = lines[1:]   # first line may be cut mid-way
+            lines = [l for l in lines if l.strip()]
+            if len(lines) >= n or start == 0:
+                return lines[-n:]
+            chunk *= 2
 
 
 def load_log(
@@ -112,15 +295,40 @@ def load_log(
     Returns:
         List of entry dicts, oldest first.
     """
+    if not n:
+        return list(iter_log(config))
     if not config.log_file.exists():
         return []
-    lines = config.log_file.read_text().strip().splitlines()
-    entries = [json.loads(l) for l in lines if l.strip()]
-    return entries[-n:] if n else entries
+    return [jsonio.loads(l) for l in _tail_lines(config.log_file, n)]
+
+
+def iter_log(config: EngineConfig = default_config) -> Iterator[dict]:
+    """
+    Yield every log entry, oldest first, one line at a time.
+
+    Use this instead of load_log() to scan a large log without holding it in
+    memory (exports, statistics, custom analysis).
+    """
+    try:
+        f = config.log_file.open("rb")
+    except FileNotFoundError:
+        return
+    with f:
+        for line in f:
+            if line.strip():
+                yield jsonio.loads(line)
 
 
 def log_count(config: EngineConfig = default_config) -> int:
     """Return total number of logged interactions."""
-    if not config.log_file.exists():
+    try:
+        size = config.log_file.stat().st_size
+    except FileNotFoundError:
         return 0
-    return sum(1 for l in config.log_file.open() if l.strip())
+    cached = _read_count(config)
+    if cached and cached[1] == size:
+        return cached[0]
+    with config.log_file.open("rb") as f:
+        count = sum(1 for l in f if l.strip())
+    _write_count(config, count, size)
+    return count
@@ -0,0 +1,101 @@
+"""
+embedcache.py
+-------------
+Embedding cache in front of llm.embed, so a text is only sent to Ollama once.
+
+Chat turns repeat the same or similar questions, and every belief is
+re-embedded whenever the belief index is rebuilt. Vectors are kept in an
+in-process LRU and persisted to data_dir/embed_cache.sqlite, so they survive
+restarts too. Keys are (embedding model, SHA-256 of the text): an embedding
+never goes stale for a given model, so there is no TTL.
+
+Public API:
+    embed_query_with_cache(text, config) -> list[float]
+    clear_cache()
+"""
+
+import hashlib
+import sqlite3
+import threading
+from array import array
+from collections import OrderedDict
+
+from .config import EngineConfig, default_config
+from . import llm as _llm
+
+MAX_CACHED = 4096
+
+_lock = threading.Lock()
+_memory: OrderedDict[tuple[str, bytes], list[float]] = OrderedDict()
+_conns: dict[str, sqlite3.Connection] = {}
+
+
+def _db(config: EngineConfig) -> sqlite3.Connection:
+    """One connection per cache file for the life of the process. Call under _lock."""
+    path = str(config.embed_cache_file)
+    conn = _conns.get(path)
+    if conn is None:
+        config.ensure_dirs()
+        conn = sqlite3.connect(path, check_same_thread=False)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings ("
+            "  model TEXT NOT NULL, digest BLOB NOT NULL, vector BLOB NOT NULL,"
+            "  PRIMARY KEY (model, digest))"
+        )
+        _conns[path] = conn
+    return conn
+
+
+def _remember(key: tuple[str, bytes], vector: list[float]):
+    _memory[key] = vector
+    _memory.move_to_end(key)
+    if len(_memory) > MAX_CACHED:
+        _memory.popitem(last=False)
+
+
+# ── Public API ────────────────────────────────────────────────────────────────
+
+def embed_query_with_cache(
+    text: str,
+    config: EngineConfig = default_config,
+) -> list[float]:
+    """
+    Drop-in replacement for llm.embed(text, config) that checks memory, then
+    embed_cache.sqlite, and only calls Ollama on a miss.
+    Raises RuntimeError (like llm.embed) if Ollama is needed and unreachable.
+    """
+    key = (config.embed_model, hashlib.sha256(text.encode()).digest())
+
+    with _lock:
+        vector = _memory.get(key)
+        if vector is not None:
+            _memory.move_to_end(key)
+            return vector
+        row = _db(config).execute(
+            "SELECT vector FROM embeddings WHERE model = ? AND digest = ?", key
+        ).fetchone()
+        if row:
+            vector = array("d", row[0]).tolist()
+            _remember(key, vector)
+            return vector
+
+    vector = _llm.embed(text, config=config)
+
+    with _lock:
+        conn = _db(config)
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO embeddings VALUES (?, ?, ?)",
+                (*key, array("d", vector).tobytes()),
+            )
+        _remember(key, vector)
+    return vector
+
+
+def clear_cache():
+    """Forget in-memory vectors and close cache files (the files are kept)."""
+    with _lock:
+        _memory.clear()
+        for conn in _conns.values():
+            conn.close()
+        _conns.clear()
@@ -14,18 +14,27 @@ Supported platforms and their export formats:
 Public API:
     ingest(source, platform, config, user_handle) -> IngestResult
     ingest_file(filepath, platform, config, user_handle) -> IngestResult
+    ingest_files(filepaths, platform, config, user_handle) -> list[IngestResult]
 """
 
 import json
+import os
 import re
 import csv
 import io
 from pathlib import Path
 from datetime import datetime, timezone
 from dataclasses import dataclass, field
+from typing import BinaryIO, Iterable, TextIO
 
 from .config import EngineConfig, default_config
-from .core import log_interaction
+from .core import log_interactions
+from . import jsonio
+
+try:
+    import ijson   # optional: streams large Telegram exports
+except ImportError:
+    ijson = None
 
 
 # ── Result object ─────────────────────────────────────────────────────────────
@@ -50,12 +59,19 @@ class IngestResult:
 
 # ── Normalised entry ──────────────────────────────────────────────────────────
 
+# Tags shared by every entry from a platform, built once
+_BASE_TAGS: dict[str, tuple[str, ...]] = {
+    p: (f"source:{p}", "social_media")
+    for p in ("whatsapp", "twitter", "linkedin", "instagram", "telegram", "generic")
+}
+
+
 def _make_entry(
     question:  str,
     answer:    str,
     platform:  str,
     timestamp: str | None = None,
-    extra_tags: list[str] | None = None,
+    extra_tags: tuple[str, ...] | None = None,
 ) -> dict:
     """
     Build a log entry from social content.
@@ -63,9 +79,9 @@ def _make_entry(
     For posts (monologues):   question="" answer=post_text
     For chats (dialogues):    question=their_message answer=user_message
     """
-    tags = [f"source:{platform}", "social_media"]
+    tags = _BASE_TAGS.get(platform) or (f"source:{platform}", "social_media")
     if extra_tags:
-        tags += extra_tags
+        tags += tuple(extra_tags)
 
     return {
         "question":   question.strip(),
@@ -74,83 +90,93 @@ def _make_entry(
     }
 
 
-def _write_entry(entry: dict, config: EngineConfig) -> bool:
-    """Write a normalised entry to the log. Returns True on success."""
-    if not entry["answer"].strip():
-        return False
-    try:
-        log_interaction(
-            question   = entry["question"],
-            answer     = entry["answer"],
-            config     = config,
-            extra_tags = entry.get("extra_tags", []),
-        )
-        return True
-    except Exception:
-        return False
-
-
 # ══════════════════════════════════════════════════════════════════════════════
 # Platform parsers
 # ══════════════════════════════════════════════════════════════════════════════
 
+# Line-oriented formats (WhatsApp, CSV) also accept an open text file and parse
+# it as it is read, so large exports are never held in memory as one string.
+_STREAMED  = {"whatsapp", "linkedin_posts", "linkedin_messages", "csv"}
+_READ_BLOCK = 1 << 20
+
 # ── WhatsApp ──────────────────────────────────────────────────────────────────
 
+# One pass over the whole export (MULTILINE) instead of a match per line.
+# [^\S\n] is "whitespace except newline", so a match never runs into the
+# next line; the message group ends on a non-space, as on a stripped line.
 _WA_LINE = re.compile(
-    r"^(\d{1,2}/\d{1,2}/\d{2,4}),?\s+"   # date
-    r"(\d{1,2}:\d{2}(?::\d{2})?(?:\s?[AP]M)?)\s+-\s+"  # time
-    r"([^:]+):\s+"                          # sender
-    r"(.+)$"                                # message
+    r"^[^\S\n]*(\d{1,2}/\d{1,2}/\d{2,4}),?[^\S\n]+"                     # date
+    r"(\d{1,2}:\d{2}(?::\d{2})?(?:[^\S\n]?[AP]M)?)[^\S\n]+-[^\S\n]+"  # time
+    r"([^:\n]+):[^\S\n]+"                                               # sender
+    r"(.*\S)[^\S\n]*$",                                                 # message
+    re.MULTILINE,
 )
 
-def _parse_whatsapp(text: str, user_handle: str | None) -> list[dict]:
+def _wa_continuation(fragments: list[str], between: str):
+    """Append the text between two message lines to the earlier message's fragments."""
+    for line in between.splitlines():
+        if line.strip() and not line.startswith("\u200e"):
+            fragments.append(line.strip())
+
+
+def _parse_whatsapp(text: str | TextIO, user_handle: str | None) -> list[dict]:
     """
-    Parse WhatsApp export txt.
+    Parse WhatsApp export txt (the text, or an open text file read in ~1 MB
+    blocks of whole lines).
     Groups consecutive messages into Q/A pairs where possible.
     If user_handle provided, user's messages become 'answer', others become 'question'.
     If no handle, treats each message as a standalone post (question="").
     """
     entries = []
-    messages = []
+    messages = []   # (sender, [first line, continuation lines...])
 
-    for line in text.splitlines():
-        m = _WA_LINE.match(line.strip())
-        if m:
+    if isinstance(text, str):
+        blocks: Iterable[str] = (text,)
+    else:
+        blocks = iter(lambda: "".join(text.readlines(_READ_BLOCK)), "")
+
+    for block in blocks:
+        pos = 0
+        for m in _WA_LINE.finditer(block):
+            if messages:
+                # lines between two matches (or before the first match of a
+                # block) are continuations of the earlier message
+                _wa_continuation(messages[-1][1], block[pos:m.start()])
             _, _, sender, content = m.groups()
-            messages.append({"sender": sender.strip(), "content": content.strip()})
-        elif messages and line.strip() and not line.startswith("\u200e"):
-            # continuation of previous message
-            messages[-1]["content"] += " " + line.strip()
+            messages.append((sender.strip(), [content.strip()]))
+            pos = m.end()
+        if messages:
+            _wa_continuation(messages[-1][1], block[pos:])
 
     if not messages:
         return entries
 
     if user_handle:
         # Pair messages into Q/A
-        i = 0
-        while i < len(messages):
-            msg = messages[i]
-            if msg["sender"].lower() == user_handle.lower():
-                # find preceding message from someone else as the question
-                question = ""
-                if i > 0 and messages[i-1]["sender"].lower() != user_handle.lower():
-                    question = messages[i-1]["content"]
+        handle = user_handle.lower()
+        prev_lc, prev_content = handle, ""   # no previous message → no question
+        for sender, fragments in messages:
+            sender_lc = sender.lower()
+            content = " ".join(fragments)
+            if sender_lc == handle:
+                # preceding message from someone else is the question
                 entries.append(_make_entry(
-                    question  = question,
-                    answer    = msg["content"],
+                    question  = prev_content if prev_lc != handle else "",
+                    answer    = content,
                     platform  = "whatsapp",
-                    extra_tags= ["chat"],
+                    extra_tags= ("chat",),
                 ))
-            i += 1
+            prev_lc, prev_content = sender_lc, content
     else:
         # No handle — treat each message as a standalone post
-        for msg in messages:
-            if len(msg["content"]) > 20:  # skip very short messages
+        for _, fragments in messages:
+            content = " ".join(fragments)
+            if len(content) > 20:  # skip very short messages
                 entries.append(_make_entry(
                     question  = "",
-                    answer    = msg["content"],
+                    answer    = content,
                     platform  = "whatsapp",
-                    extra_tags= ["chat"],
+                    extra_tags= ("chat",),
                 ))
 
     return entries
@@ -158,20 +184,27 @@ def _parse_whatsapp(text: str, user_handle: str | None) -> list[dict]:
 
 # ── Twitter / X ───────────────────────────────────────────────────────────────
 
+_TW_WRAPPER = re.compile(r"\s*window\.[^=]+=\s*")   # window.YTD.tweets.part0 =
+_TW_URL     = re.compile(r"https://t\.co/\S+")
+_TW_MENTION = re.compile(r"@\w+")
+
 def _parse_twitter(text: str) -> list[dict]:
     """
     Parse tweets.js from Twitter archive.
     Strips the JavaScript wrapper and extracts tweet text.
     Filters out retweets — only original tweets.
     """
-    # Strip JS wrapper: window.YTD.tweets.part0 = [...]
-    clean = re.sub(r"^window\.[^=]+=\s*", "", text.strip())
+    # Skip the JS wrapper (window.YTD.tweets.part0 = [...]) and parse from
+    # the array in place, rather than building a copy of the text without it
+    wrapper = _TW_WRAPPER.match(text)
     try:
-        data = json.loads(clean)
+        data = jsonio.loads_from(text, wrapper.end() if wrapper else 0)
     except json.JSONDecodeError:
-        # Try parsing as plain JSON array
+        # Slow path: whitespace JSON doesn't allow (e.g. NBSP) around the export
+        clean = text.strip()
+        wrapper = _TW_WRAPPER.match(clean)
         try:
-            data = json.loads(text)
+            data = jsonio.loads_from(clean, wrapper.end() if wrapper else 0)
         except Exception:
             return []
 
@@ -183,14 +216,18 @@ def _parse_twitter(text: str) -> list[dict]:
         content = tweet.get("full_text") or tweet.get("text", "")
 
         # Skip retweets and replies to others
-        if content.startswith("RT @"):
-            continue
-        if content.startswith("@") and not tweet.get("in_reply_to_user_id") == "":
+        if content.startswith("RT @") or (
+            content.startswith("@") and tweet.get("in_reply_to_user_id") != ""
+        ):
             continue
 
-        # Clean URLs and mentions for cleaner text
-        content = re.sub(r"https://t\.co/\S+", "", content).strip()
-        content = re.sub(r"@\w+", "", content).strip()
+        # Clean URLs and mentions for cleaner text — most tweets have neither,
+        # and a substring check is much cheaper than a regex pass that finds nothing
+        if "t.co/" in content:
+            content = _TW_URL.sub("", content)
+        if "@" in content:
+            content = _TW_MENTION.sub("", content)
+        content = content.strip()
 
         if len(content) < 15:
             continue
@@ -199,7 +236,7 @@ def _parse_twitter(text: str) -> list[dict]:
             question  = "",
             answer    = content,
             platform  = "twitter",
-            extra_tags= ["post", "tweet"],
+            extra_tags= ("post", "tweet"),
         ))
 
     return entries
@@ -207,64 +244,94 @@ def _parse_twitter(text: str) -> list[dict]:
 
 # ── LinkedIn ──────────────────────────────────────────────────────────────────
 
-def _parse_linkedin_posts(text: str) -> list[dict]:
+def _csv_reader(source: str | TextIO):
+    return csv.reader(io.StringIO(source) if isinstance(source, str) else source)
+
+
+def _csv_columns(header: list[str], names: tuple[str, ...]) -> list[int]:
+    """
+    Indices of the named columns, in the order of names. Resolved once per
+    file so rows can be read by index instead of through a dict per row.
+    With duplicate headers the last one wins, as with csv.DictReader.
+    """
+    pos = {h: i for i, h in enumerate(header)}
+    return [pos[n] for n in names if n in pos]
+
+
+def _first_value(row: list[str], cols: list[int]) -> str:
+    """First non-empty cell among cols (the row.get(a) or row.get(b) idiom)."""
+    for i in cols:
+        if i < len(row) and row[i]:
+            return row[i]
+    return ""
+
+
+def _parse_linkedin_posts(text: str | TextIO) -> list[dict]:
     """Parse LinkedIn posts.csv export."""
     entries = []
     try:
-        reader = csv.DictReader(io.StringIO(text))
+        reader = _csv_reader(text)
+        header = next(reader, None)
+        if header is None:
+            return entries
+        # LinkedIn export columns vary — try common ones
+        content_cols = _csv_columns(header, ("ShareCommentary", "Content", "Text", "Description"))
         for row in reader:
-            # LinkedIn export columns vary — try common ones
-            content = (
-                row.get("ShareCommentary") or
-                row.get("Content") or
-                row.get("Text") or
-                row.get("Description") or ""
-            )
-            content = content.strip()
+            if not row:
+                continue
+            content = _first_value(row, content_cols).strip()
             if len(content) < 20:
                 continue
             entries.append(_make_entry(
                 question  = "",
                 answer    = content,
                 platform  = "linkedin",
-                extra_tags= ["post"],
+                extra_tags= ("post",),
             ))
     except Exception:
         pass
     return entries
 
 
-def _parse_linkedin_messages(text: str, user_handle: str | None) -> list[dict]:
+def _parse_linkedin_messages(text: str | TextIO, user_handle: str | None) -> list[dict]:
     """Parse LinkedIn messages.csv export."""
     entries = []
     try:
-        reader = csv.DictReader(io.StringIO(text))
-        rows = list(reader)
-        for i, row in enumerate(rows):
-            sender  = (row.get("SENDER NAME") or row.get("From") or "").strip()
-            content = (row.get("CONTENT") or row.get("Body") or "").strip()
+        reader = _csv_reader(text)
+        header = next(reader, None)
+        if header is None:
+            return entries
+        handle       = user_handle.lower() if user_handle else None
+        sender_cols  = _csv_columns(header, ("SENDER NAME", "From"))
+        content_cols = _csv_columns(header, ("CONTENT", "Body"))
+        # (sender, sender lowercased, content) — each row's fields are read once
+        # and reused when the row is the previous message of the next one
+        rows = []
+        for row in reader:
+            if row:
+                sender = _first_value(row, sender_cols).strip()
+                rows.append((sender, sender.lower(), _first_value(row, content_cols).strip()))
 
+        for i, (sender, sender_lc, content) in enumerate(rows):
             if not content or len(content) < 10:
                 continue
 
             # If we know who the user is, only log their messages
-            if user_handle and sender.lower() != user_handle.lower():
+            if handle and sender_lc != handle:
                 continue
 
             # Use previous message as context/question if from different sender
             question = ""
             if i > 0:
-                prev = rows[i-1]
-                prev_sender  = (prev.get("SENDER NAME") or prev.get("From") or "").strip()
-                prev_content = (prev.get("CONTENT") or prev.get("Body") or "").strip()
-                if prev_sender.lower() != sender.lower() and prev_content:
+                _, prev_sender_lc, prev_content = rows[i-1]
+                if prev_sender_lc != sender_lc and prev_content:
                     question = prev_content
 
             entries.append(_make_entry(
                 question  = question,
                 answer    = content,
                 platform  = "linkedin",
-                extra_tags= ["message", "chat"],
+                extra_tags= ("message", "chat"),
             ))
     except Exception:
         pass
@@ -281,7 +348,7 @@ def _parse_instagram(text: str, user_handle: str | None) -> list[dict]:
     """
     entries = []
     try:
-        data = json.loads(text)
+        data = jsonio.loads(text)
     except json.JSONDecodeError:
         return entries
 
@@ -295,33 +362,35 @@ def _parse_instagram(text: str, user_handle: str | None) -> list[dict]:
                         question  = "",
                         answer    = caption,
                         platform  = "instagram",
-                        extra_tags= ["post", "caption"],
+                        extra_tags= ("post", "caption"),
                     ))
         return entries
 
     # DM format
     messages = data.get("messages", [])
     if messages:
+        handle = user_handle.lower() if user_handle else None
         for i, msg in enumerate(messages):
             sender  = msg.get("sender_name", "").strip()
             content = msg.get("content", "").strip()
 
             if not content or len(content) < 10:
                 continue
-            if user_handle and sender.lower() != user_handle.lower():
+            sender_lc = sender.lower()
+            if handle and sender_lc != handle:
                 continue
 
             question = ""
             if i > 0:
                 prev = messages[i-1]
-                if prev.get("sender_name", "").lower() != sender.lower():
+                if prev.get("sender_name", "").lower() != sender_lc:
                     question = prev.get("content", "").strip()
 
             entries.append(_make_entry(
                 question  = question,
                 answer    = content,
                 platform  = "instagram",
-                extra_tags= ["dm", "chat"],
+                extra_tags= ("dm", "chat"),
             ))
 
     return entries
@@ -331,54 +400,78 @@ def _parse_instagram(text: str, user_handle: str | None) -> list[dict]:
 
 def _parse_telegram(text: str, user_handle: str | None) -> list[dict]:
     """Parse Telegram export JSON (result.json)."""
-    entries = []
     try:
-        data = json.loads(text)
+        data = jsonio.loads(text)
     except json.JSONDecodeError:
-        return entries
+        return []
+    return _telegram_entries(data.get("messages", []), user_handle)
 
-    messages = data.get("messages", [])
 
-    for i, msg in enumerate(messages):
+def _parse_telegram_stream(fp: BinaryIO, user_handle: str | None) -> list[dict]:
+    """
+    Parse Telegram result.json from an open binary file.
+
+    With ijson installed, messages are decoded one at a time so the export
+    (often hundreds of MB) is never held in memory as a whole; without it
+    this is a whole-file decode plus _telegram_entries(). ijson rejects
+    invalid UTF-8, so a file it can't stream falls back to the whole-file
+    decode, which drops undecodable bytes — the result doesn't depend on
+    whether ijson is installed.
+    """
+    if ijson is not None:
+        try:
+            return _telegram_entries(ijson.items(fp, "messages.item"), user_handle)
+        except (ijson.JSONError, UnicodeDecodeError):
+            fp.seek(0)
+    try:
+        data = jsonio.loads(fp.read().decode("utf-8", errors="ignore"))
+    except json.JSONDecodeError:
+        return []
+    return _telegram_entries(data.get("messages", []), user_handle)
+
+
+def _render_text(raw) -> str:
+    """Telegram message text: a plain string, or a list of strings and text entities."""
+    if isinstance(raw, list):
+        return " ".join(
+            part if isinstance(part, str) else part.get("text", "")
+            for part in raw
+        ).strip()
+    return str(raw).strip()
+
+
+def _telegram_entries(messages: Iterable[dict], user_handle: str | None) -> list[dict]:
+    entries = []
+    handle  = user_handle.lower() if user_handle else None
+    # sender and text of the previous item, rendered once and carried forward
+    # (None when it was not a message) — messages can be a one-pass iterator
+    prev_sender_lc: str | None = None
+    prev_content = ""
+
+    for msg in messages:
         if msg.get("type") != "message":
+            prev_sender_lc = None
             continue
 
-        sender  = str(msg.get("from", "")).strip()
+        sender_lc = str(msg.get("from", "")).strip().lower()
         # content can be string or list of text entities
-        raw     = msg.get("text", "")
-        if isinstance(raw, list):
-            content = " ".join(
-                part if isinstance(part, str) else part.get("text", "")
-                for part in raw
-            ).strip()
-        else:
-            content = str(raw).strip()
+        content   = _render_text(msg.get("text", ""))
+
+        question = ""
+        if prev_sender_lc is not None and prev_sender_lc != sender_lc:
+            question = prev_content
+        prev_sender_lc, prev_content = sender_lc, content
 
         if not content or len(content) < 10:
             continue
-        if user_handle and sender.lower() != user_handle.lower():
+        if handle and sender_lc != handle:
             continue
 
-        question = ""
-        if i > 0:
-            prev = messages[i-1]
-            if prev.get("type") == "message":
-                prev_sender = str(prev.get("from", "")).strip()
-                if prev_sender.lower() != sender.lower():
-                    prev_raw = prev.get("text", "")
-                    if isinstance(prev_raw, list):
-                        question = " ".join(
-                            p if isinstance(p, str) else p.get("text", "")
-                            for p in prev_raw
-                        ).strip()
-                    else:
-                        question = str(prev_raw).strip()
-
         entries.append(_make_entry(
             question  = question,
             answer    = content,
             platform  = "telegram",
-            extra_tags= ["chat", "message"],
+            extra_tags= ("chat", "message"),
         ))
 
     return entries
@@ -386,7 +479,7 @@ def _parse_telegram(text: str, user_handle: str | None) -> list[dict]:
 
 # ── Generic CSV / JSON ────────────────────────────────────────────────────────
 
-def _parse_generic_csv(text: str) -> list[dict]:
+def _parse_generic_csv(text: str | TextIO) -> list[dict]:
     """
     Generic CSV parser. Looks for text/content/message/post columns.
     First text-like column with content > 20 chars is used as answer.
@@ -395,22 +488,27 @@ def _parse_generic_csv(text: str) -> list[dict]:
     TEXT_COLS = ["text", "content", "message", "post", "body",
                  "caption", "description", "comment", "reply"]
     try:
-        reader = csv.DictReader(io.StringIO(text))
+        reader = _csv_reader(text)
+        header = next(reader, None)
+        if header is None:
+            return entries
+        # candidate columns in TEXT_COLS priority order, resolved once
+        pos  = {h: i for i, h in enumerate(header)}
+        cols = [pos[h] for col in TEXT_COLS for h in pos if h.lower().strip() == col]
+        if not cols:
+            return entries
         for row in reader:
             content = ""
-            for col in TEXT_COLS:
-                for key in row:
-                    if key.lower().strip() == col and len(row[key].strip()) > 20:
-                        content = row[key].strip()
-                        break
-                if content:
+            for i in cols:
+                if i < len(row) and len(row[i].strip()) > 20:
+                    content = row[i].strip()
                     break
             if content:
                 entries.append(_make_entry(
                     question  = "",
                     answer    = content,
                     platform  = "generic",
-                    extra_tags= ["imported"],
+                    extra_tags= ("imported",),
                 ))
     except Exception:
         pass
@@ -427,7 +525,7 @@ def _parse_generic_json(text: str) -> list[dict]:
     TEXT_KEYS = ["text", "content", "message", "post", "body",
                  "caption", "description", "comment"]
     try:
-        data = json.loads(text)
+        data = jsonio.loads(text)
         if isinstance(data, dict):
             # unwrap common container keys
             for key in ["posts", "messages", "data", "items", "tweets"]:
@@ -438,13 +536,13 @@ def _parse_generic_json(text: str) -> list[dict]:
         if isinstance(data, list):
             for item in data:
                 if isinstance(item, str) and len(item) > 20:
-                    entries.append(_make_entry("", item, "generic", extra_tags=["imported"]))
+                    entries.append(_make_entry("", item, "generic", extra_tags=("imported",)))
                 elif isinstance(item, dict):
                     for key in TEXT_KEYS:
                         val = item.get(key, "")
                         if isinstance(val, str) and len(val) > 20:
                             entries.append(_make_entry(
-                                "", val, "generic", extra_tags=["imported"]
+                                "", val, "generic", extra_tags=("imported",)
                             ))
                             break
     except Exception:
@@ -462,8 +560,86 @@ SUPPORTED_PLATFORMS = [
 ]
 
 
+def _parse(source: str | TextIO, platform: str, user_handle: str | None) -> list[dict]:
+    """Run the parser for platform (already normalised and known) on source."""
+    if not isinstance(source, str) and platform not in _STREAMED:
+        source = source.read()
+
+    if platform == "whatsapp":
+        return _parse_whatsapp(source, user_handle)
+    if platform == "twitter":
+        return _parse_twitter(source)
+    if platform == "linkedin_posts":
+        return _parse_linkedin_posts(source)
+    if platform == "linkedin_messages":
+        return _parse_linkedin_messages(source, user_handle)
+    if platform == "instagram":
+        return _parse_instagram(source, user_handle)
+    if platform == "telegram":
+        return _parse_telegram(source, user_handle)
+    if platform == "csv":
+        return _parse_generic_csv(source)
+    return _parse_generic_json(source)
+
+
+def _parse_path(path: Path, platform: str, user_handle: str | None) -> list[dict]:
+    """
+    Parse an export file, reading it the cheapest way its format allows.
+    Module-level so ingest_files() can run it in worker processes.
+    """
+    if platform == "telegram":
+        # stream the JSON from the file rather than reading it into a string
+        with path.open("rb") as fp:
+            return _parse_telegram_stream(fp, user_handle)
+    if platform in _STREAMED:
+        # same decoding as read_text() (universal newlines included), read lazily
+        with path.open(encoding="utf-8", errors="ignore", buffering=_READ_BLOCK) as f:
+            return _parse(f, platform, user_handle)
+    return _parse(path.read_text(encoding="utf-8", errors="ignore"), platform, user_handle)
+
+
+def _detect_platform(path: Path) -> str:
+    """Guess the platform from the export's filename."""
+    name = path.name.lower()
+    if "whatsapp" in name or name.endswith(".txt"):
+        return "whatsapp"
+    if "tweet" in name or name == "tweets.js":
+        return "twitter"
+    if "message" in name and name.endswith(".csv"):
+        return "linkedin_messages"
+    if name.endswith(".csv"):
+        return "linkedin_posts"
+    if "telegram" in name or "result" in name:
+        return "telegram"
+    if name.endswith(".json"):
+        return "instagram"
+    return "json"
+
+
+def _check_platform(result: IngestResult) -> bool:
+    if result.platform in SUPPORTED_PLATFORMS:
+        return True
+    result.errors.append(f"Unknown platform '{result.platform}'. "
+                         f"Supported: {', '.join(SUPPORTED_PLATFORMS)}")
+    return False
+
+
+def _prepare_file(
+    filepath: str | Path,
+    platform: str | None,
+) -> tuple[Path, IngestResult, bool]:
+    """Resolve path and platform. Returns (path, result, ok to parse)."""
+    path = Path(filepath)
+    if not path.exists():
+        r = IngestResult(platform=platform or "unknown")
+        r.errors.append(f"File not found: {filepath}")
+        return path, r, False
+    result = IngestResult(platform=(platform or _detect_platform(path)).lower().strip())
+    return path, result, _check_platform(result)
+
+
 def ingest(
-    source:      str,
+    source:      str | TextIO,
     platform:    str,
     config:      EngineConfig = default_config,
     user_handle: str | None   = None,
@@ -473,7 +649,9 @@ def ingest(
     Ingest social media content into the episodic log.
 
     Args:
-        source:      raw text content of the export file
+        source:      raw text content of the export file, or the export
+                     opened as a text file (WhatsApp and CSV exports are
+                     then parsed as they are read)
         platform:    one of: whatsapp | twitter | linkedin_posts |
                      linkedin_messages | instagram | telegram | csv | json
         config:      EngineConfig
@@ -492,44 +670,47 @@ def ingest(
             result = ingest(f.read(), platform="whatsapp", user_handle="Ashish")
         print(result.summary())
     """
-    platform = platform.lower().strip()
-    result   = IngestResult(platform=platform)
+    result = IngestResult(platform=platform.lower().strip())
+    if not _check_platform(result):
+        return result
 
-    # Parse
     try:
-        if platform == "whatsapp":
-            entries = _parse_whatsapp(source, user_handle)
-        elif platform == "twitter":
-            entries = _parse_twitter(source)
-        elif platform == "linkedin_posts":
-            entries = _parse_linkedin_posts(source)
-        elif platform == "linkedin_messages":
-            entries = _parse_linkedin_messages(source, user_handle)
-        elif platform == "instagram":
-            entries = _parse_instagram(source, user_handle)
-        elif platform == "telegram":
-            entries = _parse_telegram(source, user_handle)
-        elif platform == "csv":
-            entries = _parse_generic_csv(source)
-        elif platform == "json":
-            entries = _parse_generic_json(source)
-        else:
-            result.errors.append(f"Unknown platform '{platform}'. "
-                                  f"Supported: {', '.join(SUPPORTED_PLATFORMS)}")
-            return result
+        entries = _parse(source, result.platform, user_handle)
     except Exception as e:
         result.errors.append(f"Parse error: {e}")
         return result
 
+    return _ingest_entries(entries, result, config, verbose)
+
+
+def _ingest_entries(
+    entries: list[dict],
+    result:  IngestResult,
+    config:  EngineConfig,
+    verbose: bool,
+) -> IngestResult:
+    """Write parsed entries to the log and fill in the result counts."""
     result.total_parsed = len(entries)
 
-    # Write to log
-    config.ensure_dirs()
-    for entry in entries:
-        if _write_entry(entry, config):
-            result.total_ingested += 1
-        else:
-            result.skipped += 1
+    # Write to log — entries with an empty answer are filtered out on the way
+    # into one buffered bulk append
+    written = 0
+
+    def _pairs():
+        nonlocal written
+        for e in entries:
+            if e["answer"].strip():
+                yield e["question"], e["answer"], e.get("extra_tags", ())
+                # resumed only once the previous pair has been written
+                written += 1
+
+    try:
+        result.total_ingested = len(log_interactions(_pairs(), config=config))
+    except Exception as e:
+        # entries before the failure are already in the log — report them
+        result.total_ingested = written
+        result.errors.append(f"Write error: {e}")
+    result.skipped = result.total_parsed - result.total_ingested
 
     if verbose:
         print(f"[ingest] {result.summary()}")
@@ -563,31 +744,78 @@ def ingest_file(
         result = ingest_file("tweets.js", user_handle="ashishluthara")
         print(result.summary())
     """
-    path = Path(filepath)
+    path, result, ok = _prepare_file(filepath, platform)
+    if not ok:
+        return result
 
-    if not path.exists():
-        r = IngestResult(platform=platform or "unknown")
-        r.errors.append(f"File not found: {filepath}")
-        return r
-
-    # Auto-detect platform from filename
-    if platform is None:
-        name = path.name.lower()
-        if "whatsapp" in name or name.endswith(".txt"):
-            platform = "whatsapp"
-        elif "tweet" in name or name == "tweets.js":
-            platform = "twitter"
-        elif "message" in name and name.endswith(".csv"):
-            platform = "linkedin_messages"
-        elif name.endswith(".csv"):
-            platform = "linkedin_posts"
-        elif "telegram" in name or "result" in name:
-            platform = "telegram"
-        elif name.endswith(".json"):
-            platform = "instagram"
-        else:
-            platform = "json"
-
-    text = path.read_text(encoding="utf-8", errors="ignore")
-    return ingest(text, platform=platform, config=config,
-                  user_handle=user_handle, verbose=verbose)
+    try:
+        entries = _parse_path(path, result.platform, user_handle)
+    except Exception as e:
+        result.errors.append(f"Parse error: {e}")
+        return result
+
+    return _ingest_entries(entries, result, config, verbose)
+
+
+def ingest_files(
+    filepaths:   list[str | Path],
+    platform:    str | None   = None,
+    config:      EngineConfig = default_config,
+    user_handle: str | None   = None,
+    verbose:     bool         = True,
+    max_workers: int | None   = None,
+) -> list[IngestResult]:
+    """
+    Ingest several export files, parsing them in parallel worker processes.
+
+    Parsing is CPU-bound pure Python, so each file is parsed in its own
+    process; entries are written to the log from this process only, one
+    file at a time, in the order given.
+
+    Args:
+        filepaths:   paths to the export files
+        platform:    override platform detection for every file
+        config:      EngineConfig
+        user_handle: your username on the platforms
+        verbose:     print progress
+        max_workers: worker processes (default: one per CPU, at most one per file)
+
+    Returns:
+        One IngestResult per file, in input order.
+
+    Example:
+        from experience_engine import ingest_files
+        if __name__ == "__main__":   # required where processes are spawned (macOS, Windows)
+            for r in ingest_files(["result.json", "posts.csv", "tweets.js"], user_handle="Ashish"):
+                print(r.summary())
+    """
+    prepared = [_prepare_file(f, platform) for f in filepaths]
+    jobs = [(path, result.platform) for path, result, ok in prepared if ok]
+    workers = min(max_workers or os.cpu_count() or 1, len(jobs))
+
+    pool = None
+    if workers > 1:
+        # imported here so a plain `import experience_engine` doesn't load multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+        pool = ProcessPoolExecutor(max_workers=workers)
+    try:
+        # with a pool, every file is submitted up front and written as its turn comes
+        parsed = iter([pool.submit(_parse_path, path, p, user_handle) for path, p in jobs]
+                      if pool else [])
+        results = []
+        for path, result, ok in prepared:
+            if ok:
+                try:
+                    if pool:
+                        entries = next(parsed).result()
+                    else:
+                        entries = _parse_path(path, result.platform, user_handle)
+                except Exception as e:
+                    result.errors.append(f"Parse error: {e}")
+                else:
+                    _ingest_entries(entries, result, config, verbose)
+            results.append(result)
+    finally:
+        if pool:
+            pool.shutdown()
+    return results
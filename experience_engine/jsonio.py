@@ -0,0 +1,61 @@
+"""
+jsonio.py
+---------
+JSON encode/decode for the engine's hot paths (log appends and loads, state
+files, export parsing), plus atomic writes for the state files.
+
+Uses orjson when it is installed (pip install "experience-engine[fast]") and
+falls back to the stdlib json module otherwise, so there are still no
+required dependencies. Both write plain JSON that either one can read.
+"""
+
+import json
+import os
+import re
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps(obj, indent: bool = False) -> bytes:
+    """Serialize obj to JSON bytes: compact, or indented by 2 spaces with indent=True."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None).encode()
+
+
+def loads(data: bytes | str):
+    """Parse JSON from bytes or str. Raises json.JSONDecodeError on bad input."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def write_atomic(path: Path, obj, indent: bool = False):
+    """
+    Write obj as JSON to path via a sibling temp file and os.replace, so a
+    reader (or a crash mid-write) never sees a half-written file.
+    """
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(dumps(obj, indent=indent))
+    os.replace(tmp, path)
+
+
+_decoder = json.JSONDecoder()
+_WS = re.compile(r"[ \t\n\r]*")
+
+
+def loads_from(text: str, start: int = 0):
+    """
+    Parse the JSON document that makes up the rest of text from index start,
+    like loads(text[start:]) but without copying the text on the stdlib path.
+    """
+    if orjson is not None:
+        return orjson.loads(text[start:] if start else text)
+    obj, end = _decoder.raw_decode(text, _WS.match(text, start).end())
+    if _WS.match(text, end).end() != len(text):
+        raise json.JSONDecodeError("Extra data", text, end)
+    return obj
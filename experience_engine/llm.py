@@ -8,49 +8,346 @@ To use a different backend (OpenAI-compatible, llama.cpp, etc.):
   override call() with your own function and pass it as llm_fn= to any engine.
 """
 
+import asyncio
+import atexit
+import http.client
 import json
-import urllib.request
-from typing import Callable
+import re
+import select
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Callable, Iterable, Iterator
+from urllib.parse import urlsplit
 
 from .config import EngineConfig, default_config
+from . import jsonio
 
 
-def call(
-    prompt: str,
-    temperature: float = 0.5,
-    config: EngineConfig = default_config,
-) -> str:
+# ── Keep-alive connections ────────────────────────────────────────────────────
+# Every call used to open (and tear down) its own TCP connection to Ollama.
+# Idle connections are now pooled per host and reused, so a reflection or
+# synthesis run that makes many calls pays for the handshake once. Threads
+# (call_many) each check out their own connection; at most _MAX_IDLE per host
+# are kept when they are returned. Sockets the server closed while idle are
+# discarded at checkout, before a request is written to them.
+
+_MAX_IDLE = 16
+_HEADERS = {"Content-Type": "application/json", "Connection": "keep-alive"}
+
+_pool_lock = threading.Lock()
+_idle: dict[tuple[str, str], list[http.client.HTTPConnection]] = {}
+
+
+def _dropped(conn: http.client.HTTPConnection) -> bool:
     """
-    Call the configured local LLM. Returns response text.
-    Raises RuntimeError with a clear message if Ollama is unreachable.
+    True if an idle connection can't be reused: an idle keep-alive socket
+    that reads as ready has been closed (or written to) by the server.
+    """
+    if conn.sock is None:
+        return True
+    try:
+        return bool(select.select([conn.sock], [], [], 0)[0])
+    except (OSError, ValueError):
+        return False   # can't tell (e.g. fd beyond select's limit) — _post retries if needed
+
+
+def _checkout(scheme: str, netloc: str, timeout: float) -> tuple[http.client.HTTPConnection, bool]:
+    """Return (connection, reused) for the host, preferring a live idle one."""
+    while True:
+        with _pool_lock:
+            conns = _idle.get((scheme, netloc))
+            conn = conns.pop() if conns else None
+        if conn is None:
+            cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+            return cls(netloc, timeout=timeout), False
+        if not _dropped(conn):
+            break
+        conn.close()
+    conn.timeout = timeout
+    conn.sock.settimeout(timeout)
+    return conn, True
+
+
+def _checkin(scheme: str, netloc: str, conn: http.client.HTTPConnection):
+    """Return a connection whose last response has been fully read."""
+    with _pool_lock:
+        conns = _idle.setdefault((scheme, netloc), [])
+        if len(conns) < _MAX_IDLE:
+            conns.append(conn)
+            return
+    conn.close()
+
+
+@atexit.register
+def _close_idle():
+    with _pool_lock:
+        for conns in _idle.values():
+            for conn in conns:
+                conn.close()
+        _idle.clear()
+
+
+def _post(url: str, body: bytes, timeout: float) -> tuple[http.client.HTTPResponse, Callable[[], None]]:
+    """
+    POST body to url over a pooled connection.
+
+    Returns (response, release). Call release() once the response is done
+    with: the connection goes back to the pool if the body was read to the
+    end, and is closed otherwise.
     """
-    payload = json.dumps({
+    parts = urlsplit(url)
+    path = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+
+    while True:
+        conn, reused = _checkout(parts.scheme, parts.netloc, timeout)
+        try:
+            conn.request("POST", path, body, _HEADERS)
+            resp = conn.getresponse()
+        except (ConnectionError, http.client.HTTPException):
+            conn.close()
+            if reused:
+                continue   # the server dropped an idle keep-alive socket — retry on a new one
+            raise
+        except BaseException:
+            conn.close()
+            raise
+        break
+
+    def release():
+        if resp.isclosed():
+            _checkin(parts.scheme, parts.netloc, conn)
+        else:
+            conn.close()
+
+    if resp.status >= 400:
+        detail = resp.read().decode(errors="replace").strip()
+        release()
+        raise RuntimeError(f"HTTP {resp.status} from {url}: {detail}")
+    return resp, release
+
+
+def _payload(
+    prompt: str,
+    temperature: float,
+    config: EngineConfig,
+    stream: bool = False,
+    json_mode: bool = False,
+) -> bytes:
+    body = {
         "model":   config.model,
         "prompt":  prompt,
-        "stream":  False,
+        "stream":  stream,
         "options": {
             "temperature": temperature,
             "num_ctx":     4096,
         },
-    }).encode()
+    }
+    if json_mode:
+        body["format"] = "json"   # Ollama constrains the output to valid JSON
+    return json.dumps(body).encode()
 
-    req = urllib.request.Request(
-        config.ollama_url,
-        data=payload,
-        headers={"Content-Type": "application/json"},
-        method="POST",
+
+def _unreachable(exc: Exception, config: EngineConfig, model: str | None = None) -> RuntimeError:
+    return RuntimeError(
+        f"LLM call failed ({exc}).\n"
+        f"Make sure Ollama is running:  ollama serve\n"
+        f"Pull the model if needed:     ollama pull {model or config.model}"
     )
 
+
+_RESPONSE_KEY = re.compile(r'"response"\s*:\s*')
+_DONE_TRUE = re.compile(r'"done"\s*:\s*true')
+_decoder = json.JSONDecoder()
+
+
+def _decode_chunk(line: bytes) -> dict:
+    """
+    One streamed Ollama chunk. With orjson it is parsed in full; without it
+    only "response" and "done" are extracted. The final chunk also carries
+    "context" — every token id of the conversation, often several KB — and
+    timing stats that nothing here reads, which stdlib json would build
+    into Python objects. Both keys are looked for anywhere in the line, in
+    whatever order the server sends them: unescaped quotes only delimit
+    keys and values, so a pattern can't match inside the response text.
+    """
+    if jsonio.orjson is not None:
+        return jsonio.loads(line)
+    text = line.decode()
+    m = _RESPONSE_KEY.search(text)
+    if m is None:
+        return json.loads(text)   # {"error": ...} or anything unexpected
+    response, _ = _decoder.raw_decode(text, m.end())
+    return {"response": response, "done": _DONE_TRUE.search(text) is not None}
+
+
+def _iter_ndjson(chunks: Iterable[bytes], decode: Callable[[bytes], dict] = json.loads) -> Iterator[dict]:
+    """
+    Decode newline-delimited JSON from arbitrary byte chunks.
+
+    Only complete lines are parsed; a partial last line is held as a list of
+    fragments until its newline arrives, so each byte is decoded exactly once.
+    """
+    pending: list[bytes] = []
+    for chunk in chunks:
+        *lines, rest = chunk.split(b"\n")
+        if lines:
+            if pending:
+                pending.append(lines[0])
+                lines[0] = b"".join(pending)
+                pending = []
+            for line in lines:
+                if line.strip():
+                    yield decode(line)
+        if rest:
+            pending.append(rest)
+    tail = b"".join(pending)
+    if tail.strip():
+        yield decode(tail)
+
+
+def call(
+    prompt: str,
+    temperature: float = 0.5,
+    config: EngineConfig = default_config,
+    json_mode: bool = False,
+) -> str:
+    """
+    Call the configured local LLM. Returns response text.
+    Raises RuntimeError with a clear message if Ollama is unreachable.
+
+    json_mode=True asks Ollama to constrain the output to valid JSON. It can
+    decode much slower on some models, so the engine only uses it to retry
+    a reply that didn't parse.
+
+    The response is streamed and joined here, so no full response body is
+    buffered and decoded at the end, and config.llm_timeout bounds each wait
+    for the next chunk rather than the whole generation — a long synthesis
+    no longer times out while the model is still producing tokens.
+    """
+    return "".join(stream(prompt, temperature=temperature, config=config, json_mode=json_mode))
+
+
+def stream(
+    prompt: str,
+    *,
+    temperature: float = 0.5,
+    config: EngineConfig = default_config,
+    json_mode: bool = False,
+) -> Iterator[str]:
+    """
+    Call the configured local LLM with streaming on, yielding response text
+    as it is generated. Ollama sends one JSON object per line.
+    Raises RuntimeError (like call()) if Ollama is unreachable.
+    """
+    try:
+        resp, release = _post(
+            config.ollama_url, _payload(prompt, temperature, config, stream=True, json_mode=json_mode),
+            config.llm_timeout,
+        )
+        # if the caller stops iterating early, release() closes the half-read connection
+        try:
+            for obj in _iter_ndjson(iter(lambda: resp.read1(64 * 1024), b""), _decode_chunk):
+                if "error" in obj:
+                    raise RuntimeError(obj["error"])
+                if obj.get("response"):
+                    yield obj["response"]
+                if obj.get("done"):
+                    resp.read()   # consume the end of the chunked body so the socket can be reused
+                    break
+        finally:
+            release()
+    except Exception as exc:
+        raise _unreachable(exc, config) from exc
+
+
+def embed(
+    text: str,
+    config: EngineConfig = default_config,
+) -> list[float]:
+    """
+    Embed text with the configured Ollama embedding model.
+    Raises RuntimeError with a clear message if Ollama is unreachable.
+    """
+    payload = json.dumps({"model": config.embed_model, "prompt": text}).encode()
+
     try:
-        with urllib.request.urlopen(req, timeout=config.llm_timeout) as resp:
-            return json.loads(resp.read())["response"]
+        resp, release = _post(config.ollama_embed_url, payload, config.llm_timeout)
+        try:
+            return json.loads(resp.read())["embedding"]
+        finally:
+            release()
     except Exception as exc:
-        raise RuntimeError(
-            f"LLM call failed ({exc}).\n"
-            f"Make sure Ollama is running:  ollama serve\n"
-            f"Pull the model if needed:     ollama pull {config.model}"
-        ) from exc
+        raise _unreachable(exc, config, config.embed_model) from exc
+
+
+async def acall(
+    prompt: str,
+    temperature: float = 0.5,
+    config: EngineConfig = default_config,
+    llm_fn=None,
+) -> str:
+    """
+    Async variant of call(). The blocking request runs in a worker thread,
+    so several prompts can be awaited together.
+    """
+    return await asyncio.to_thread(llm_fn or call, prompt, temperature=temperature, config=config)
+
+
+async def _abatch(
+    prompts: list[str],
+    temperature: float,
+    config: EngineConfig,
+    llm_fn=None,
+) -> list[str]:
+    """
+    Keep exactly min(config.concurrency, len(prompts)) requests in flight:
+    a new prompt is started as soon as one finishes, so a long batch (e.g.
+    after a large ingest) never creates more tasks or threads than that.
+    """
+    limit = max(1, config.concurrency)
+    loop = asyncio.get_running_loop()
+    # size the worker pool to the window so the window really is the limit
+    loop.set_default_executor(ThreadPoolExecutor(max_workers=limit))
+
+    results: list[str] = [""] * len(prompts)
+    pending: dict[asyncio.Task, int] = {}
+    queue = iter(enumerate(prompts))
+
+    def _start(n: int):
+        for i, prompt in islice(queue, n):
+            pending[asyncio.ensure_future(acall(prompt, temperature, config, llm_fn))] = i
+
+    _start(limit)
+    try:
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                results[pending.pop(task)] = task.result()
+            _start(len(done))
+    finally:
+        for task in pending:
+            task.cancel()
+    return results
+
+
+def call_many(
+    prompts: list[str],
+    temperature: float = 0.5,
+    config: EngineConfig = default_config,
+    llm_fn=None,
+) -> list[str]:
+    """
+    Run several prompts concurrently, at most config.concurrency at a time.
+    Returns responses in prompt order.
+
+    Must be called from synchronous code (it starts its own event loop).
+    """
+    if len(prompts) <= 1:
+        return [(llm_fn or call)(p, temperature=temperature, config=config) for p in prompts]
+    return asyncio.run(_abatch(list(prompts), temperature, config, llm_fn))
 
 
-# Type alias — any function with the same signature can replace call()
+# Type aliases — any function with the same signature can replace call() / embed()
 LLMCallable = Callable[[str, float, EngineConfig], str]
+EmbedCallable = Callable[[str, EngineConfig], list[float]]
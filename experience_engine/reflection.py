@@ -6,25 +6,35 @@ V1: Extract domain beliefs from the interaction log.
 Public API:
     run_reflection(config, llm_fn) -> list[dict]   beliefs extracted
     load_beliefs(config) -> list[dict]
-    format_belief_block(beliefs) -> str            prompt-ready string
+    format_belief_block(beliefs, config, question) -> str   prompt-ready string
 """
 
 import json
 import re
+import sqlite3
 from datetime import datetime, timezone
+from functools import lru_cache
 
 from .config import EngineConfig, default_config
 from .core import load_log
+from . import jsonio
 from . import llm as _llm
+from . import store as _store
 
 
 # ── Storage ───────────────────────────────────────────────────────────────────
 
+def _load_belief_doc(config: EngineConfig) -> dict:
+    """The whole beliefs.json document, or {} if there is none yet."""
+    try:
+        return jsonio.loads(config.belief_file.read_bytes())
+    except FileNotFoundError:
+        return {}
+
+
 def load_beliefs(config: EngineConfig = default_config) -> list[dict]:
     """Load current beliefs from disk."""
-    if not config.belief_file.exists():
-        return []
-    return json.loads(config.belief_file.read_text()).get("beliefs", [])
+    return _load_belief_doc(config).get("beliefs", [])
 
 
 def _save_beliefs(beliefs: list[dict], reflection_count: int, config: EngineConfig):
@@ -33,7 +43,7 @@ def _save_beliefs(beliefs: list[dict], reflection_count: int, config: EngineConf
         "reflection_count": reflection_count,
         "beliefs":          beliefs,
     }
-    config.belief_file.write_text(json.dumps(data, indent=2))
+    jsonio.write_atomic(config.belief_file, data, indent=True)
 
 
 # ── Prompt ────────────────────────────────────────────────────────────────────
@@ -65,33 +75,78 @@ Rules:
 """
 
 
+def _fmt_one(i: int, e: dict) -> str:
+    answer = e["answer"]
+    # most answers fit — only slice the ones that don't
+    answer_preview = answer if len(answer) <= 300 else answer[:300] + "…"
+    return (
+        f"[{i}] Q: {e['question']}\n"
+        f"     A: {answer_preview}\n"
+        f"     Tags: {', '.join(e.get('tags', []))} | Confidence: {e.get('confidence', '?')}"
+    )
+
+
 def _format_interactions(entries: list[dict]) -> str:
-    parts = []
-    for i, e in enumerate(entries, 1):
-        tags = ", ".join(e.get("tags", []))
-        answer_preview = e["answer"][:300] + ("…" if len(e["answer"]) > 300 else "")
-        parts.append(
-            f"[{i}] Q: {e['question']}\n"
-            f"     A: {answer_preview}\n"
-            f"     Tags: {tags} | Confidence: {e.get('confidence', '?')}"
-        )
-    return "\n\n".join(parts)
+    return "\n\n".join(_fmt_one(i, e) for i, e in enumerate(entries, 1))
 
 
-def _parse_beliefs(raw: str) -> list[dict]:
-    raw = re.sub(r"```(?:json)?", "", raw).strip().rstrip("`").strip()
+_BELIEF_ARRAY = re.compile(r"\[.*\]", re.DOTALL)
+
+
+def _strip_fence(raw: str) -> str:
+    """Drop a ```json ... ``` fence around the whole reply (checked at the ends only)."""
+    raw = raw.strip()
+    if raw.startswith("```"):
+        raw = raw[3:].removeprefix("json")
+    return raw.removesuffix("```").strip()
+
+
+@lru_cache(maxsize=64)
+def _parse_beliefs_cached(raw: str) -> tuple:
+    # keyed on the raw reply — a regenerated identical reply skips the parse
+    raw = _strip_fence(raw)
     try:
-        data = json.loads(raw)
+        data = jsonio.loads(raw)
         if isinstance(data, list):
-            return data
+            return tuple(data)
     except json.JSONDecodeError:
-        match = re.search(r"\[.*\]", raw, re.DOTALL)
+        match = _BELIEF_ARRAY.search(raw)
         if match:
             try:
-                return json.loads(match.group())
+                return tuple(jsonio.loads(match.group()))
             except Exception:
                 pass
-    return []
+    return ()
+
+
+def _parse_beliefs(raw: str) -> list[dict]:
+    # fresh dicts each call, so callers can't mutate what's cached
+    return [dict(b) if isinstance(b, dict) else b for b in _parse_beliefs_cached(raw)]
+
+
+def _commit_beliefs(
+    beliefs: list[dict],
+    reflection_count: int,
+    config: EngineConfig,
+    verbose: bool,
+) -> list[dict]:
+    """Filter parsed beliefs by confidence, save them and refresh the index."""
+    filtered = [b for b in beliefs if b.get("confidence", 0) >= config.min_belief_confidence]
+
+    _save_beliefs(filtered, reflection_count, config)
+
+    if verbose:
+        print(f"[reflection] ✓ {len(filtered)} beliefs saved.")
+
+    if config.belief_top_k:
+        try:
+            _store.index_beliefs(filtered, config)
+        except (RuntimeError, sqlite3.Error) as exc:
+            # the index is rebuilt on demand later — don't lose the reflection over it
+            if verbose:
+                print(f"[reflection] Belief index not updated: {exc}")
+
+    return filtered
 
 
 # ── Public API ────────────────────────────────────────────────────────────────
@@ -126,12 +181,10 @@ def run_reflection(
             print("[reflection] No interactions logged yet.")
         return []
 
-    existing = load_beliefs(config)
-
-    # load reflection count from disk
-    reflection_count = 0
-    if config.belief_file.exists():
-        reflection_count = json.loads(config.belief_file.read_text()).get("reflection_count", 0)
+    # beliefs and reflection count come from one read of beliefs.json
+    doc = _load_belief_doc(config)
+    existing = doc.get("beliefs", [])
+    reflection_count = doc.get("reflection_count", 0)
 
     if verbose:
         print(f"[reflection] Analyzing {len(entries)} interactions…")
@@ -139,34 +192,34 @@ def run_reflection(
     prompt = _REFLECTION_PROMPT.format(
         n=len(entries),
         interactions=_format_interactions(entries),
-        existing=json.dumps(existing, indent=2) if existing else "None yet.",
+        existing=jsonio.dumps(existing, indent=True).decode() if existing else "None yet.",
         min_conf=config.min_belief_confidence,
     )
 
     raw = _call(prompt, temperature=config.llm_temperature_reflect, config=config)
-    beliefs = _parse_beliefs(raw)
-    filtered = [b for b in beliefs if b.get("confidence", 0) >= config.min_belief_confidence]
-
-    _save_beliefs(filtered, reflection_count + 1, config)
+    return _commit_beliefs(_parse_beliefs(raw), reflection_count + 1, config, verbose)
 
-    if verbose:
-        print(f"[reflection] ✓ {len(filtered)} beliefs saved.")
 
-    return filtered
+# ── Prompt injection ──────────────────────────────────────────────────────────
 
+def _confidence(belief: dict) -> float:
+    return belief.get("confidence", 0)
 
-# ── Prompt injection ──────────────────────────────────────────────────────────
 
 def format_belief_block(
     beliefs: list[dict] | None = None,
     config: EngineConfig = default_config,
+    question: str | None = None,
 ) -> str:
     """
     Return a prompt-ready string of current beliefs for injection into chat prompts.
 
     Args:
-        beliefs: pass beliefs directly, or leave None to load from disk
-        config:  EngineConfig
+        beliefs:  pass beliefs directly, or leave None to load from disk
+        config:   EngineConfig
+        question: the current user message. With config.belief_top_k > 0, only
+                  the top-k beliefs most relevant to it are included (falls
+                  back to all beliefs if the embedding model is unavailable).
 
     Returns:
         Formatted string block, empty string if no beliefs exist.
@@ -175,7 +228,15 @@ def format_belief_block(
         beliefs = load_beliefs(config)
     if not beliefs:
         return ""
+    if question and 0 < config.belief_top_k < len(beliefs):
+        try:
+            beliefs = _store.search_beliefs(question, config.belief_top_k, beliefs, config)
+        except (RuntimeError, sqlite3.Error):
+            pass   # embedding model down, or index.sqlite unusable — inject all beliefs
     lines = ["## What I know about you (domain beliefs)\n"]
-    for b in sorted(beliefs, key=lambda x: -x.get("confidence", 0)):
-        lines.append(f"- {b['belief']} ({b.get('confidence', 0):.0%})")
-    return "\n".join(lines) + "\n\n"
+    lines += [
+        f"- {b['belief']} ({b.get('confidence', 0):.0%})"
+        for b in sorted(beliefs, key=_confidence, reverse=True)
+    ]
+    lines += ("", "")   # trailing blank line, built by the same join
+    return "\n".join(lines)
@@ -0,0 +1,164 @@
+"""
+store.py
+--------
+Optional embedding index over beliefs, for relevance-ranked prompt injection.
+
+With EngineConfig.belief_top_k > 0, run_reflection() embeds every belief into
+data_dir/index.sqlite and format_belief_block(question=...) injects only the
+k beliefs closest to the current question instead of the whole file.
+
+Nearest-neighbour search runs inside SQLite through the sqlite-vec extension
+when it is installed (pip install sqlite-vec). Without it, vectors are kept as
+float32 blobs in a plain table and ranked with a cosine scan in Python.
+beliefs.json stays the source of truth: the index is a cache that is rebuilt
+whenever it no longer matches the beliefs, and can be deleted at any time.
+Embeddings go through embedcache, so rebuilding it only embeds new beliefs.
+
+Public API:
+    index_beliefs(beliefs, config, embed_fn) -> int
+    search_beliefs(query, k, beliefs, config, embed_fn) -> list[dict]
+"""
+
+import hashlib
+import math
+import sqlite3
+from array import array
+
+from .config import EngineConfig, default_config
+from . import jsonio
+from .embedcache import embed_query_with_cache
+
+try:
+    import sqlite_vec
+except ImportError:
+    sqlite_vec = None
+
+
+def _connect(config: EngineConfig) -> tuple[sqlite3.Connection, bool]:
+    """Open the index. Returns (connection, sqlite-vec loaded)."""
+    config.ensure_dirs()
+    conn = sqlite3.connect(config.index_file)
+    conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+    if sqlite_vec is not None:
+        try:
+            conn.enable_load_extension(True)
+            sqlite_vec.load(conn)
+            conn.enable_load_extension(False)
+            return conn, True
+        except (AttributeError, sqlite3.Error):
+            pass   # Python built without extension loading — use the fallback
+    return conn, False
+
+
+def _digest(beliefs: list[dict], config: EngineConfig, vec: bool) -> str:
+    # covers everything the index depends on: beliefs, embedding model, backend
+    key = f"{config.embed_model}|{vec}|".encode() + jsonio.dumps(beliefs)
+    return hashlib.sha256(key).hexdigest()
+
+
+def _unit(vec: list[float]) -> array:
+    # unit vectors make L2 order (sqlite-vec default) equal to cosine order
+    norm = math.sqrt(sum(x * x for x in vec)) or 1.0
+    return array("f", (x / norm for x in vec))
+
+
+def _indexed_digest(conn: sqlite3.Connection) -> str | None:
+    row = conn.execute("SELECT value FROM meta WHERE key = 'digest'").fetchone()
+    return row[0] if row else None
+
+
+# ── Public API ────────────────────────────────────────────────────────────────
+
+def index_beliefs(
+    beliefs: list[dict],
+    config: EngineConfig = default_config,
+    embed_fn=None,
+) -> int:
+    """
+    Rebuild the belief index from scratch.
+
+    Args:
+        beliefs:  belief dicts (as saved in beliefs.json)
+        config:   EngineConfig
+        embed_fn: optional replacement for the cached llm.embed (text, config) -> vector
+
+    Returns:
+        Number of beliefs indexed.
+    """
+    _embed = embed_fn or embed_query_with_cache
+    vectors = [_unit(_embed(b["belief"], config=config)) for b in beliefs]
+    dim = len(vectors[0]) if vectors else 0
+
+    conn, vec = _connect(config)
+    try:
+        with conn:
+            conn.execute("DROP TABLE IF EXISTS beliefs")
+            conn.execute("DROP TABLE IF EXISTS belief_vectors")
+            conn.execute("DROP TABLE IF EXISTS vec_beliefs")
+            conn.execute("CREATE TABLE beliefs (id INTEGER PRIMARY KEY, json TEXT NOT NULL)")
+            if vec and dim:
+                conn.execute(f"CREATE VIRTUAL TABLE vec_beliefs USING vec0(embedding float[{dim}])")
+                table = "vec_beliefs(rowid, embedding)"
+            else:
+                conn.execute("CREATE TABLE belief_vectors (id INTEGER PRIMARY KEY, embedding BLOB)")
+                table = "belief_vectors(id, embedding)"
+            for i, (belief, v) in enumerate(zip(beliefs, vectors)):
+                conn.execute("INSERT INTO beliefs VALUES (?, ?)", (i, jsonio.dumps(belief).decode()))
+                conn.execute(f"INSERT INTO {table} VALUES (?, ?)", (i, v.tobytes()))
+            conn.execute(
+                "INSERT OR REPLACE INTO meta VALUES ('digest', ?)", (_digest(beliefs, config, vec),)
+            )
+    finally:
+        conn.close()
+    return len(beliefs)
+
+
+def search_beliefs(
+    query: str,
+    k: int,
+    beliefs: list[dict],
+    config: EngineConfig = default_config,
+    embed_fn=None,
+) -> list[dict]:
+    """
+    Return the k beliefs most similar to query, most similar first.
+
+    The index is rebuilt first if it was built from a different belief list
+    (e.g. beliefs.json was edited by hand), so results always come from the
+    beliefs passed in.
+    """
+    if not beliefs or k <= 0:
+        return []
+
+    conn, vec = _connect(config)
+    try:
+        stale = _indexed_digest(conn) != _digest(beliefs, config, vec)
+    finally:
+        conn.close()
+    if stale:
+        index_beliefs(beliefs, config, embed_fn)
+
+    q = _unit((embed_fn or embed_query_with_cache)(query, config=config))
+    conn, vec = _connect(config)
+    try:
+        if vec:
+            rows = conn.execute(
+                "SELECT b.json FROM ("
+                "  SELECT rowid, distance FROM vec_beliefs"
+                "  WHERE embedding MATCH ? ORDER BY distance LIMIT ?"
+                ") v JOIN beliefs b ON b.id = v.rowid ORDER BY v.distance",
+                (q.tobytes(), k),
+            ).fetchall()
+            return [jsonio.loads(r[0]) for r in rows]
+
+        scored = []
+        for belief_json, blob in conn.execute(
+            "SELECT b.json, v.embedding FROM beliefs b JOIN belief_vectors v ON v.id = b.id"
+        ):
+            v = array("f")
+            v.frombytes(blob)
+            scored.append((sum(a * b for a, b in zip(q, v)), belief_json))
+        scored.sort(key=lambda s: -s[0])
+        return [jsonio.loads(j) for _, j in scored[:k]]
+    finally:
+        conn.close()
@@ -4,31 +4,127 @@ synthesis.py
 V2: Extract cross-domain cognitive patterns from beliefs.
 
 Public API:
-    run_synthesis(config, llm_fn) -> dict        full synthesis result
+    run_synthesis(config, llm_fn, force) -> dict full synthesis result (reused if beliefs unchanged)
     load_patterns(config) -> dict
     load_tensions(config) -> list[dict]
     format_cognitive_block(config) -> str        prompt-ready string
+    apply_patterns(situation, config, llm_fn) -> str
+    apply_patterns_batch(situations, config, llm_fn, batch_size) -> list[str]
+    run_reflection_and_synthesis(config, llm_fn) -> dict   both steps, one LLM call
 """
 
-import json
+import copy
+import hashlib
+import logging
+import marshal
+import os
 import re
 from datetime import datetime, timezone
+from functools import partial
+from pathlib import Path
+from typing import Iterator
 
 from .config import EngineConfig, default_config
 from .core import load_log, log_count
-from .reflection import load_beliefs
+from .reflection import (
+    load_beliefs, run_reflection, _load_belief_doc, _format_interactions, _commit_beliefs,
+)
+from . import jsonio
 from . import llm as _llm
 
 
+_log = logging.getLogger(__name__)
+
+
+def _report(verbose: bool, msg: str, *args):
+    """
+    Progress message: printed when verbose (as before), otherwise sent to the
+    module logger at DEBUG, %-formatted only if that level is enabled.
+    """
+    if verbose:
+        print("[synthesis] " + (msg % args if args else msg))
+    else:
+        _log.debug(msg, *args)
+
+
 _ARCHETYPES = [
     "control-first", "scale-first", "research-first",
     "execution-first", "safety-first", "depth-first", "simplicity-first",
 ]
 
 # ── Storage ───────────────────────────────────────────────────────────────────
+# Chat injects the cognitive block on every turn, so parsed state files are
+# cached per path and only re-read when their mtime or size changes. Strings
+# built from a document (prompt preambles, the cognitive block) are kept next
+# to it and go away with it.
 
-def load_patterns(config: EngineConfig = default_config) -> dict:
-    if not config.pattern_file.exists():
+#
+# Each file also gets a .marshal sidecar holding the same document, which a
+# new process loads several times faster than the JSON. It records the JSON
+# file's (mtime, size) and is only used while those match, so the JSON stays
+# the source of truth and a hand edit is picked up as usual. Sidecars are only
+# written when the engine saves the files; loading never writes.
+
+# path → ((st_mtime_ns, st_size), document, derived values)
+_FILE_CACHE: dict[Path, tuple[tuple[int, int], dict, dict]] = {}
+
+
+def _sidecar(path: Path) -> Path:
+    return path.with_suffix(".marshal")
+
+
+def _write_sidecar(path: Path, key: tuple[int, int], data: dict):
+    """Cache data for the JSON file at path in its state key; best effort."""
+    side = _sidecar(path)
+    tmp = side.with_name(side.name + ".tmp")
+    try:
+        tmp.write_bytes(marshal.dumps((marshal.version, key, data)))
+        os.replace(tmp, side)
+    except (OSError, ValueError):
+        pass   # read-only data dir, or an unmarshallable value — the JSON still works
+
+
+def _read_sidecar(path: Path, key: tuple[int, int]) -> dict | None:
+    """The cached document for the JSON file at path if it is still current, else None."""
+    try:
+        version, side_key, data = marshal.loads(_sidecar(path).read_bytes())
+    except (OSError, EOFError, ValueError, TypeError):
+        return None   # missing, or written by an incompatible Python
+    return data if version == marshal.version and tuple(side_key) == key else None
+
+
+def _stat_key(path: Path) -> tuple[int, int]:
+    st = path.stat()
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _load_cached(path: Path) -> dict | None:
+    """Parsed JSON document at path (shared — don't mutate), or None if missing."""
+    try:
+        key = _stat_key(path)
+    except FileNotFoundError:
+        _FILE_CACHE.pop(path, None)
+        return None
+    hit = _FILE_CACHE.get(path)
+    if hit is not None and hit[0] == key:
+        return hit[1]
+    data = _read_sidecar(path, key)
+    if data is None:
+        data = jsonio.loads(path.read_bytes())
+    _FILE_CACHE[path] = (key, data, {})
+    return data
+
+
+def _derived(path: Path) -> dict:
+    """Values computed from the document last loaded from path (emptied when it changes)."""
+    hit = _FILE_CACHE.get(path)
+    return hit[2] if hit is not None else {}
+
+
+def _patterns_doc(config: EngineConfig) -> dict:
+    """The cached synthesis result (shared — don't mutate). Internal callers read this."""
+    data = _load_cached(config.pattern_file)
+    if data is None:
         return {
             "last_updated": None, "synthesis_count": 0,
             "abstraction_ladder": {"observations": [], "themes": [], "patterns": [], "biases": []},
@@ -36,17 +132,40 @@ def load_patterns(config: EngineConfig = default_config) -> dict:
             "decision_archetype": {"dominant": None, "distribution": {}, "history": []},
             "experience_compression": {"total_events": 0, "total_patterns": 0, "compression_ratio": None},
         }
-    return json.loads(config.pattern_file.read_text())
+    return data
 
 
-def load_tensions(config: EngineConfig = default_config) -> list[dict]:
-    if not config.tension_file.exists():
+def _tension_list(config: EngineConfig) -> list[dict]:
+    """The cached tensions (shared — don't mutate)."""
+    data = _load_cached(config.tension_file)
+    if data is None:
         return []
-    return json.loads(config.tension_file.read_text()).get("tensions", [])
+    return data.get("tensions", [])
 
 
-def _save_synthesis(result: dict, synthesis_count: int, total_events: int, config: EngineConfig):
-    patterns     = result.get("cognitive_patterns", [])
+def load_patterns(config: EngineConfig = default_config) -> dict:
+    """Load the synthesis result (parsed once per file state, returned as a fresh copy)."""
+    return copy.deepcopy(_patterns_doc(config))
+
+
+def load_tensions(config: EngineConfig = default_config) -> list[dict]:
+    """Load current tensions (parsed once per file state, returned as a fresh copy)."""
+    return copy.deepcopy(_tension_list(config))
+
+
+def _confidence(item: dict) -> float:
+    return item.get("confidence", 0)
+
+
+def _save_synthesis(
+    result: dict,
+    synthesis_count: int,
+    total_events: int,
+    config: EngineConfig,
+    input_hash: str | None = None,
+):
+    # strongest first, so readers can take a prefix
+    patterns     = sorted(result.get("cognitive_patterns", []), key=_confidence, reverse=True)
     tensions     = result.get("tensions", [])
     archetype    = result.get("decision_archetype", {})
     ladder       = result.get("abstraction_ladder", {})
@@ -63,14 +182,21 @@ def _save_synthesis(result: dict, synthesis_count: int, total_events: int, confi
             "compression_ratio": f"{total_events}:{len(patterns)}" if patterns else "N/A",
         },
     }
-    config.pattern_file.write_text(json.dumps(pattern_data, indent=2))
+    if input_hash:
+        pattern_data["input_hash"] = input_hash
+    jsonio.write_atomic(config.pattern_file, pattern_data, indent=config.pretty_json)
+    _write_sidecar(config.pattern_file, _stat_key(config.pattern_file), pattern_data)
 
     tension_data = {
         "last_updated": datetime.now(timezone.utc).isoformat(),
         "tensions":     tensions,
         "resolved":     [],
     }
-    config.tension_file.write_text(json.dumps(tension_data, indent=2))
+    jsonio.write_atomic(config.tension_file, tension_data, indent=config.pretty_json)
+    _write_sidecar(config.tension_file, _stat_key(config.tension_file), tension_data)
+
+    _FILE_CACHE.pop(config.pattern_file, None)
+    _FILE_CACHE.pop(config.tension_file, None)
 
 
 # ── Prompt ────────────────────────────────────────────────────────────────────
@@ -125,37 +251,279 @@ Hard rules:
 - Return ONLY the JSON object. No markdown. No explanation.
 """
 
+# Split around {beliefs} once. The beliefs JSON (the bulk of the prompt) is then
+# copied into an exactly-sized join instead of str.format's growing buffer.
+_SYNTHESIS_HEAD, _SYNTHESIS_TAIL = _SYNTHESIS_PROMPT.split("{beliefs}")
+
+
+_COMBINED_PROMPT = """\
+You are a reflection engine and cognitive pattern analyst. Complete task [A],
+then task [B] using the beliefs from [A], and answer both in one JSON object.
+
+## Interactions (most recent {n} sessions)
+{interactions}
+
+## Existing Beliefs
+{existing}
+
+## Interaction Count
+{log_count} total interactions logged.
+
+## [A] Beliefs
+Extract durable beliefs about the user — their goals, preferences, working
+style, and recurring frustrations. Each belief object must have:
+  - "belief":      a clear, specific statement about the user (string)
+  - "confidence":  float 0.0–1.0
+  - "evidence":    1–2 sentence summary of supporting evidence (string)
+  - "category":    one of: goal | technical_preference | working_style |
+                   frustration | domain_knowledge | value
+Rules:
+1. Update confidence on existing beliefs if new evidence supports or contradicts.
+2. Add new beliefs only if supported by at least 2 interactions.
+3. Exclude beliefs with confidence < {min_conf}.
+4. Be specific — "prefers Python" > "likes coding".
+
+## [B] Cognitive synthesis
+From the beliefs in [A], analyze HOW the user thinks — their cognitive
+signature across all domains — as an object with these exact keys:
+
+"abstraction_ladder": {{
+  "observations": [3-6 specific behavioral observations],
+  "themes":       [2-4 recurring cross-domain themes],
+  "patterns":     [2-3 domain-agnostic cognitive patterns],
+  "biases":       [1-2 potential blind spots]
+}}
+
+"cognitive_patterns": [
+  {{
+    "pattern":               "precise, domain-agnostic behavioral statement",
+    "confidence":            float 0.0-1.0,
+    "cross_domain_evidence": ["example from domain A", "example from domain B"],
+    "transfer_hypothesis":   "one sentence predicting behavior in a new unseen domain"
+  }}
+]
+
+"decision_archetype": {{
+  "dominant":     "one of: {archetypes}",
+  "distribution": {{"archetype_name": weight_float, ...}}  // must sum to 1.0
+}}
+
+"tensions": [
+  {{
+    "belief_a":         "first conflicting belief",
+    "belief_b":         "second conflicting belief",
+    "tension":          "why they conflict (1-2 sentences)",
+    "strategic_question": "the exact question to resolve the tension",
+    "severity":         float 0.0-1.0
+  }}
+]
+
+Hard rules for [B]:
+- Patterns MUST be cross-domain. Single-domain = belief, not pattern.
+- "User prefers X" is NOT a pattern. "User applies X-reasoning across Y and Z" IS.
+
+## Output
+Return ONLY this JSON object. No markdown. No explanation.
+{{"beliefs": [ ...belief objects from [A]... ], "synthesis": {{ ...object from [B]... }}}}
+"""
+
+
+# a whole JSON string literal (so braces inside it are skipped), or a brace
+_JSON_TOKEN = re.compile(r'"(?:[^"\\]|\\.)*"|[{}]', re.DOTALL)
+
+
+def _json_objects(s: str) -> Iterator[str]:
+    """Yield each top-level {...} span in s, in order, in one pass over it."""
+    depth = start = 0
+    for m in _JSON_TOKEN.finditer(s):
+        ch = m.group()
+        if ch == "{":
+            if depth == 0:
+                start = m.start()
+            depth += 1
+        elif ch == "}" and depth:
+            depth -= 1
+            if depth == 0:
+                yield s[start:m.end()]
+
 
 def _parse_result(raw: str) -> dict:
-    raw = re.sub(r"```(?:json)?", "", raw).strip().rstrip("`").strip()
+    raw = raw.replace("```json", "").replace("```", "").strip().rstrip("`").strip()
     try:
-        return json.loads(raw)
+        return jsonio.loads(raw)
     except Exception:
-        match = re.search(r"\{.*\}", raw, re.DOTALL)
-        if match:
+        # usually prose around one object: first "{" to last "}"
+        start, end = raw.find("{"), raw.rfind("}") + 1
+        if 0 <= start < end:
             try:
-                return json.loads(match.group())
+                return jsonio.loads(raw[start:end])
             except Exception:
                 pass
+            # stray braces or several objects — take the first balanced {...} that parses
+            for candidate in _json_objects(raw[start:end]):
+                try:
+                    return jsonio.loads(candidate)
+                except Exception:
+                    pass
     return {}
 
 
+def _ask_json(prompt: str, temperature: float, config: EngineConfig, llm_fn, verbose: bool) -> dict:
+    """
+    Call the LLM and parse the JSON object in its reply ({} if there is none).
+
+    With the built-in Ollama adapter and config.json_retry, a reply that
+    doesn't parse is retried once in Ollama's JSON mode. JSON mode isn't
+    used up front: it decodes much slower on some models, and most replies
+    parse without it.
+    """
+    result = _parse_result((llm_fn or _llm.call)(prompt, temperature=temperature, config=config))
+    if not result and llm_fn is None and config.json_retry:
+        _report(verbose, "Reply was not valid JSON — retrying in JSON mode…")
+        result = _parse_result(
+            _llm.call(prompt, temperature=temperature, config=config, json_mode=True)
+        )
+    return result
+
+
+# Bump when the synthesis prompt or the shard merge changes, so results
+# saved by the old version are not reused for unchanged beliefs.
+_SYNTHESIS_VERSION = 1
+
+
+def _input_hash(beliefs: list[dict], config: EngineConfig) -> str:
+    # covers everything a synthesis result depends on except the log count,
+    # which changes every chat turn: beliefs, model, sharding, prompt version
+    key = (
+        f"{_SYNTHESIS_VERSION}|{config.model}|{config.synth_shard_threshold}|".encode()
+        + jsonio.dumps(beliefs)
+    )
+    return hashlib.blake2b(key, digest_size=16).hexdigest()
+
+
+# ── Sharding ──────────────────────────────────────────────────────────────────
+# Large belief sets are synthesized in shards that run concurrently and are
+# merged, instead of in one prompt that outgrows the context window.
+
+def _synthesis_prompt(beliefs: list[dict], tail: str) -> str:
+    return "".join((_SYNTHESIS_HEAD, jsonio.dumps(beliefs, indent=True).decode(), tail))
+
+
+def _shards(beliefs: list[dict], size: int) -> list[list[dict]]:
+    """
+    Split beliefs into shards of at most size. Beliefs are dealt round-robin
+    in category order, so every shard holds a slice of every category —
+    patterns must be cross-domain, which a shard per category can't show.
+    """
+    n = -(-len(beliefs) // size)
+    ordered = sorted(beliefs, key=lambda b: (str(b.get("category", "other")), -_confidence(b)))
+    return [ordered[i::n] for i in range(n)]
+
+
+def _merge_results(results: list[dict], weights: list[int]) -> dict:
+    """
+    Merge shard synthesis results: ladder entries and tensions are unioned,
+    patterns deduplicated by statement (keeping the most confident), and the
+    archetype distributions averaged, weighted by shard size.
+    """
+    ladder: dict[str, list] = {}
+    patterns: dict[str, dict] = {}
+    tensions: dict[tuple, dict] = {}
+    distribution: dict[str, float] = {}
+
+    for result, weight in zip(results, weights):
+        for level, items in (result.get("abstraction_ladder") or {}).items():
+            merged = ladder.setdefault(level, [])
+            if isinstance(items, list):
+                merged.extend(i for i in items if i not in merged)
+        for p in result.get("cognitive_patterns", []):
+            key = " ".join(str(p.get("pattern", "")).split()).casefold()
+            if key and (key not in patterns or _confidence(p) > _confidence(patterns[key])):
+                patterns[key] = p
+        for t in result.get("tensions", []):
+            key = tuple(sorted((str(t.get("belief_a", "")), str(t.get("belief_b", "")))))
+            if key not in tensions or t.get("severity", 0) > tensions[key].get("severity", 0):
+                tensions[key] = t
+        arch = result.get("decision_archetype") or {}
+        for name, w in (arch.get("distribution") or {}).items():
+            if isinstance(w, (int, float)):
+                distribution[name] = distribution.get(name, 0) + w * weight
+
+    total = sum(distribution.values())
+    distribution = {k: round(v / total, 3) for k, v in distribution.items()} if total else {}
+    dominant = max(distribution, key=distribution.get) if distribution else next(
+        ((r.get("decision_archetype") or {}).get("dominant") for r in results
+         if (r.get("decision_archetype") or {}).get("dominant")), None,
+    )
+    return {
+        "abstraction_ladder": ladder,
+        "cognitive_patterns": list(patterns.values()),
+        "decision_archetype": {"dominant": dominant, "distribution": distribution},
+        "tensions":           list(tensions.values()),
+    }
+
+
+def _synthesize_sharded(
+    beliefs: list[dict],
+    tail: str,
+    config: EngineConfig,
+    llm_fn,
+    verbose: bool,
+) -> dict:
+    """Synthesize beliefs shard by shard, concurrently (config.concurrency), and merge."""
+    shards = _shards(beliefs, config.synth_shard_threshold)
+    temperature = config.llm_temperature_synthesize
+    _report(verbose, "Splitting into %d shards, synthesized concurrently…", len(shards))
+
+    prompts = [_synthesis_prompt(shard, tail) for shard in shards]
+    results = [
+        _parse_result(raw)
+        for raw in _llm.call_many(prompts, temperature=temperature, config=config, llm_fn=llm_fn)
+    ]
+
+    failed = [i for i, r in enumerate(results) if not isinstance(r, dict) or not r]
+    if failed and llm_fn is None and config.json_retry:
+        _report(verbose, "%d shard replies were not valid JSON — retrying in JSON mode…", len(failed))
+        replies = _llm.call_many(
+            [prompts[i] for i in failed], temperature=temperature, config=config,
+            llm_fn=partial(_llm.call, json_mode=True),
+        )
+        for i, raw in zip(failed, replies):
+            results[i] = _parse_result(raw)
+
+    parsed = [(r, len(s)) for r, s in zip(results, shards) if isinstance(r, dict) and r]
+    if not parsed:
+        return {}
+    if len(parsed) < len(shards):
+        _report(verbose, "%d of %d shards could not be parsed — merging the rest.",
+                len(shards) - len(parsed), len(shards))
+    return _merge_results([r for r, _ in parsed], [w for _, w in parsed])
+
+
 # ── Public API ────────────────────────────────────────────────────────────────
 
 def run_synthesis(
     config: EngineConfig = default_config,
     llm_fn=None,
     verbose: bool = True,
+    force: bool = False,
 ) -> dict:
     """
     Read beliefs → extract cognitive patterns → update cognitive_patterns.json + tensions.json.
 
-    Run run_reflection() first — synthesis reads from beliefs.json.
+    Run run_reflection() first — synthesis reads from beliefs.json. With more
+    than config.synth_shard_threshold beliefs, they are split into shards that
+    are synthesized concurrently and merged into one result.
+
+    If the beliefs haven't changed since the last synthesis, the saved result
+    is returned without calling the LLM.
 
     Args:
         config:  EngineConfig
         llm_fn:  optional replacement LLM callable
-        verbose: print progress to stdout
+        verbose: print progress to stdout (otherwise it goes to the
+                 "experience_engine.synthesis" logger at DEBUG)
+        force:   synthesize even if the beliefs are unchanged
 
     Returns:
         Full synthesis result dict with keys:
@@ -167,43 +535,149 @@ def run_synthesis(
         for p in result["cognitive_patterns"]:
             print(p["pattern"], p["confidence"])
     """
-    _call = llm_fn or _llm.call
-
     beliefs = load_beliefs(config)
     if not beliefs:
-        if verbose:
-            print("[synthesis] No beliefs found. Run run_reflection() first.")
+        _report(verbose, "No beliefs found. Run run_reflection() first.")
         return {}
 
+    existing      = _patterns_doc(config)
+    input_hash    = _input_hash(beliefs, config)
+
+    if not force and existing.get("input_hash") == input_hash:
+        _report(verbose, "Beliefs unchanged since synthesis #%d — reusing it.",
+                existing.get("synthesis_count", 0))
+        # copies: the loaded documents are shared through _FILE_CACHE
+        return copy.deepcopy({
+            "abstraction_ladder": existing.get("abstraction_ladder", {}),
+            "cognitive_patterns": existing.get("cognitive_patterns", []),
+            "decision_archetype": existing.get("decision_archetype", {}),
+            "tensions":           _tension_list(config),
+        })
+
     total_events  = log_count(config)
-    existing      = load_patterns(config)
     synth_count   = existing.get("synthesis_count", 0)
 
-    if verbose:
-        print(f"[synthesis] Synthesizing from {len(beliefs)} beliefs, {total_events} interactions…")
+    _report(verbose, "Synthesizing from %d beliefs, %d interactions…", len(beliefs), total_events)
+
+    tail = _SYNTHESIS_TAIL.format(log_count=total_events, archetypes=", ".join(_ARCHETYPES))
+    if 0 < config.synth_shard_threshold < len(beliefs):
+        result = _synthesize_sharded(beliefs, tail, config, llm_fn, verbose)
+    else:
+        prompt = _synthesis_prompt(beliefs, tail)
+        result = _ask_json(prompt, config.llm_temperature_synthesize, config, llm_fn, verbose)
 
-    prompt = _SYNTHESIS_PROMPT.format(
-        beliefs=json.dumps(beliefs, indent=2),
+    if not result:
+        _report(verbose, "Parsing failed — check LLM output.")
+        return {}
+
+    _save_synthesis(result, synth_count + 1, total_events, config, input_hash)
+
+    _report(verbose, "✓ %d patterns, %d tensions saved.",
+            len(result.get("cognitive_patterns", [])), len(result.get("tensions", [])))
+
+    return result
+
+
+def run_reflection_and_synthesis(
+    config: EngineConfig = default_config,
+    llm_fn=None,
+    verbose: bool = True,
+) -> dict:
+    """
+    run_reflection() followed by run_synthesis(), in a single LLM call.
+
+    Both tasks go into one prompt ([A] beliefs, [B] patterns from those
+    beliefs), so the interactions are prefilled once and there is one
+    round trip instead of two. Results are saved exactly as the two steps
+    save them. If the combined reply can't be parsed, the two steps are
+    run separately instead.
+
+    Returns:
+        {"beliefs": [...saved beliefs], "synthesis": {...synthesis result}}
+
+    Example:
+        from experience_engine import run_reflection_and_synthesis
+        out = run_reflection_and_synthesis()
+        print(len(out["beliefs"]), out["synthesis"]["decision_archetype"])
+    """
+    entries = load_log(n=config.reflection_window, config=config)
+    if not entries:
+        _report(verbose, "No interactions logged yet.")
+        return {}
+
+    doc              = _load_belief_doc(config)
+    existing         = doc.get("beliefs", [])
+    reflection_count = doc.get("reflection_count", 0)
+    total_events     = log_count(config)
+    synth_count      = _patterns_doc(config).get("synthesis_count", 0)
+
+    _report(verbose, "Reflecting on %d interactions and synthesizing in one call…", len(entries))
+
+    prompt = _COMBINED_PROMPT.format(
+        n=len(entries),
+        interactions=_format_interactions(entries),
+        existing=jsonio.dumps(existing, indent=True).decode() if existing else "None yet.",
         log_count=total_events,
+        min_conf=config.min_belief_confidence,
         archetypes=", ".join(_ARCHETYPES),
     )
+    temperature = min(config.llm_temperature_reflect, config.llm_temperature_synthesize)
 
-    raw    = _call(prompt, temperature=config.llm_temperature_synthesize, config=config)
-    result = _parse_result(raw)
+    combined  = _ask_json(prompt, temperature, config, llm_fn, verbose)
+    beliefs   = combined.get("beliefs") if isinstance(combined, dict) else None
+    synthesis = combined.get("synthesis") if isinstance(combined, dict) else None
 
-    if not result:
-        if verbose:
-            print("[synthesis] Parsing failed — check LLM output.")
-        return {}
+    if not isinstance(beliefs, list) or not isinstance(synthesis, dict) or not synthesis:
+        _report(verbose, "Combined reply not parseable — running the two steps separately.")
+        beliefs = run_reflection(config=config, llm_fn=llm_fn, verbose=verbose)
+        return {"beliefs": beliefs, "synthesis": run_synthesis(config, llm_fn, verbose)}
 
-    _save_synthesis(result, synth_count + 1, total_events, config)
+    beliefs = _commit_beliefs(beliefs, reflection_count + 1, config, verbose)
+    # hashed like run_synthesis() hashes beliefs.json, so an immediate re-run is skipped
+    _save_synthesis(synthesis, synth_count + 1, total_events, config, _input_hash(beliefs, config))
 
-    n_patterns = len(result.get("cognitive_patterns", []))
-    n_tensions = len(result.get("tensions", []))
-    if verbose:
-        print(f"[synthesis] ✓ {n_patterns} patterns, {n_tensions} tensions saved.")
+    _report(verbose, "✓ %d patterns, %d tensions saved.",
+            len(synthesis.get("cognitive_patterns", [])), len(synthesis.get("tensions", [])))
 
-    return result
+    return {"beliefs": beliefs, "synthesis": synthesis}
+
+
+def _prompt_patterns(patterns: list[dict], config: EngineConfig) -> list[dict]:
+    """The config.max_prompt_patterns strongest patterns (all of them if 0)."""
+    # files saved by this version are already sorted; this orders older ones
+    ranked = sorted(patterns, key=_confidence, reverse=True)
+    return ranked[:config.max_prompt_patterns] if config.max_prompt_patterns else ranked
+
+
+def _patterns_json(patterns: list[dict], config: EngineConfig) -> str:
+    """patterns (from _patterns_doc) as the transfer prompts show them, serialised once per file."""
+    derived = _derived(config.pattern_file)
+    cached = derived.get("patterns_json")
+    if cached is not None and cached[0] == config.max_prompt_patterns:
+        return cached[1]
+    text = jsonio.dumps(_prompt_patterns(patterns, config), indent=True).decode()
+    derived["patterns_json"] = (config.max_prompt_patterns, text)
+    return text
+
+
+def _transfer_prompt(situation: str, patterns_json: str, archetype: str) -> str:
+    return f"""\
+You are an AI advisor with deep knowledge of this user's cognitive patterns.
+
+## Cognitive Patterns
+{patterns_json}
+
+## Dominant Archetype: {archetype}
+
+## New Situation
+{situation}
+
+Apply the user's cognitive patterns to this situation.
+Name which patterns are relevant. Predict their instinct.
+Flag if their instinct contradicts their archetype.
+Give a direct recommendation in their cognitive style.
+Write in prose. No lists. Be specific. Four to eight sentences.
+"""
 
 
 def apply_patterns(
@@ -228,31 +702,96 @@ def apply_patterns(
         print(analysis)
     """
     _call = llm_fn or _llm.call
-    patterns_data = load_patterns(config)
+    patterns_data = _patterns_doc(config)
     patterns      = patterns_data.get("cognitive_patterns", [])
     archetype     = patterns_data.get("decision_archetype", {}).get("dominant", "unknown")
 
     if not patterns:
         return "No cognitive patterns available. Run run_synthesis() first."
 
-    prompt = f"""\
+    prompt = _transfer_prompt(situation, _patterns_json(patterns, config), archetype)
+    return _call(prompt, temperature=0.5, config=config)
+
+
+def _transfer_batch_prompt(situations: list[str], patterns_json: str, archetype: str) -> str:
+    numbered = "\n\n".join(f"[{i}] {s}" for i, s in enumerate(situations, 1))
+    return f"""\
 You are an AI advisor with deep knowledge of this user's cognitive patterns.
 
 ## Cognitive Patterns
-{json.dumps(patterns, indent=2)}
+{patterns_json}
 
 ## Dominant Archetype: {archetype}
 
-## New Situation
-{situation}
+## New Situations
+{numbered}
 
-Apply the user's cognitive patterns to this situation.
+For EACH situation, apply the user's cognitive patterns to it.
 Name which patterns are relevant. Predict their instinct.
 Flag if their instinct contradicts their archetype.
 Give a direct recommendation in their cognitive style.
-Write in prose. No lists. Be specific. Four to eight sentences.
+Write in prose. No lists. Be specific. Four to eight sentences per situation.
+
+Return ONLY a JSON object mapping each situation number to its analysis:
+{{"1": "analysis of situation 1", "2": "analysis of situation 2", ...}}
+No markdown. No explanation.
 """
-    return _call(prompt, temperature=0.5, config=config)
+
+
+def apply_patterns_batch(
+    situations: list[str],
+    config: EngineConfig = default_config,
+    llm_fn=None,
+    batch_size: int = 8,
+) -> list[str]:
+    """
+    apply_patterns() for several situations.
+
+    Situations are packed batch_size to a prompt, so the shared patterns
+    preamble is sent (and prefilled) once per batch instead of once per
+    situation, and the batches run concurrently (up to config.concurrency in
+    flight). Any situation missing from a batch reply is re-asked on its own.
+    batch_size=1 sends one prompt per situation.
+
+    Returns:
+        One analysis string per situation, in input order.
+    """
+    patterns_data = _patterns_doc(config)
+    patterns      = patterns_data.get("cognitive_patterns", [])
+    archetype     = patterns_data.get("decision_archetype", {}).get("dominant", "unknown")
+
+    if not patterns:
+        return ["No cognitive patterns available. Run run_synthesis() first."] * len(situations)
+
+    patterns_json = _patterns_json(patterns, config)
+    size          = max(1, batch_size)
+    groups        = [situations[i:i + size] for i in range(0, len(situations), size)]
+    prompts       = [
+        _transfer_prompt(g[0], patterns_json, archetype) if len(g) == 1
+        else _transfer_batch_prompt(g, patterns_json, archetype)
+        for g in groups
+    ]
+    replies = _llm.call_many(prompts, temperature=0.5, config=config, llm_fn=llm_fn)
+
+    results: list[str | None] = []
+    for group, raw in zip(groups, replies):
+        if len(group) == 1:
+            results.append(raw)
+            continue
+        parsed = _parse_result(raw)
+        if not isinstance(parsed, dict):
+            parsed = {}
+        for i in range(1, len(group) + 1):
+            text = parsed.get(str(i))
+            results.append(text.strip() if isinstance(text, str) and text.strip() else None)
+
+    missing = [i for i, r in enumerate(results) if r is None]
+    if missing:
+        retry = [_transfer_prompt(situations[i], patterns_json, archetype) for i in missing]
+        replies = _llm.call_many(retry, temperature=0.5, config=config, llm_fn=llm_fn)
+        for i, text in zip(missing, replies):
+            results[i] = text
+    return results
 
 
 # ── Prompt injection ──────────────────────────────────────────────────────────
@@ -263,8 +802,8 @@ def format_cognitive_block(config: EngineConfig = default_config) -> str:
 
     Returns empty string if no synthesis has been run yet.
     """
-    patterns_data = load_patterns(config)
-    tensions      = load_tensions(config)
+    patterns_data = _patterns_doc(config)
+    tensions      = _tension_list(config)
 
     patterns  = patterns_data.get("cognitive_patterns", [])
     archetype = patterns_data.get("decision_archetype", {})
@@ -272,8 +811,15 @@ def format_cognitive_block(config: EngineConfig = default_config) -> str:
     if not patterns:
         return ""
 
+    # built once per (pattern file, tension file) state — chat calls this every turn
+    derived     = _derived(config.pattern_file)
+    block_key   = (_FILE_CACHE.get(config.tension_file, (None,))[0], config.max_prompt_patterns)
+    cached      = derived.get("block")
+    if cached is not None and cached[0] == block_key:
+        return cached[1]
+
     lines = ["## Cognitive Signature (how this user thinks)\n"]
-    for p in sorted(patterns, key=lambda x: -x.get("confidence", 0)):
+    for p in _prompt_patterns(patterns, config):
         lines.append(f"- {p['pattern']} ({p['confidence']:.0%})")
 
     if archetype.get("dominant"):
@@ -291,4 +837,6 @@ def format_cognitive_block(config: EngineConfig = default_config) -> str:
         "Apply cross-domain transfer when relevant. "
         "No lists. Direct prose only. Name patterns by label.\n"
     )
-    return "\n".join(lines)
+    block = "\n".join(lines)
+    derived["block"] = (block_key, block)
+    return block